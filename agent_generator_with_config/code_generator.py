@@ -17,41 +17,216 @@ Deterministic Config-to-Code Generator for ADK Agents.
 Converts JSON configuration to Python agent code files.
 """
 
+from __future__ import annotations
+
 import os
-import json
+import ast
+import functools
+import operator
+import py_compile
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import warnings
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
-try:
-    from .config_schema import AgentProjectConfig, AgentConfig, ToolConfig, AgentType, BuiltinToolType
-except ImportError:
-    from config_schema import AgentProjectConfig, AgentConfig, ToolConfig, AgentType, BuiltinToolType
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Final, FrozenSet, Iterator, List, Set, Union
+
+if TYPE_CHECKING:
+    # The schema pulls in Pydantic; it is only loaded when a config is actually parsed
+    try:
+        from .config_schema import AgentProjectConfig, AgentConfig, ToolConfig
+    except ImportError:
+        from config_schema import AgentProjectConfig, AgentConfig, ToolConfig
+
+
+# License header placed at the top of every generated Python file
+LICENSE_HEADER: Final[str] = """# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+
+INIT_FILE_CONTENT: Final[str] = LICENSE_HEADER + """
+# Generated agent package
+"""
+
+# Fallbacks for LLM agents that leave these fields empty
+DEFAULT_MODEL = "gemini-2.0-flash-lite-001"
+DEFAULT_INSTRUCTION = "You are a helpful AI assistant."
+
+# Bytecode variants written next to generated modules: plain and "python -O"
+PRECOMPILE_OPTIMIZE_LEVELS = (0, 1)
+
+# Worker threads shared by every generator for rendering agent blocks; only used
+# on free-threaded builds, where the blocks can actually render at the same time
+RENDER_MAX_WORKERS = 8
+_RENDER_POOL = None
+_RENDER_POOL_LOCK = threading.Lock()
+
+
+def _get_render_pool() -> ThreadPoolExecutor:
+    """Return the shared render pool, creating it on first use."""
+    global _RENDER_POOL
+    if _RENDER_POOL is None:
+        with _RENDER_POOL_LOCK:
+            if _RENDER_POOL is None:
+                _RENDER_POOL = ThreadPoolExecutor(
+                    max_workers=RENDER_MAX_WORKERS,
+                    thread_name_prefix="adk-codegen",
+                )
+    return _RENDER_POOL
+
+
+def _render_in_parallel() -> bool:
+    """Whether agent blocks should go to the render pool instead of rendering inline."""
+    # With the GIL the pool only adds hand-off overhead; this can flip at runtime
+    # if an extension module re-enables the GIL
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+# Imports every generated agent.py starts with
+BASE_IMPORTS: Final[frozenset] = frozenset({
+    "from google.adk.agents.llm_agent import LlmAgent",
+    "from google.adk.agents.sequential_agent import SequentialAgent",
+    "from google.adk.agents.parallel_agent import ParallelAgent",
+    "from google.adk.agents.loop_agent import LoopAgent",
+    "from google.adk.tools.function_tool import FunctionTool",
+    "from google.genai import types",
+})
+
+
+# A single import statement, optionally aliased: "import a.b as c, d" or "from .a import (b as c, d)"
+_IMPORT_NAME = r"\w+(?:\s+as\s+\w+)?"
+_IMPORT_RE = re.compile(
+    rf"\s*(?:"
+    rf"import\s+[\w.]+(?:\s+as\s+\w+)?(?:\s*,\s*[\w.]+(?:\s+as\s+\w+)?)*"
+    rf"|from\s+(?:\.+[\w.]*|[\w.]+)\s+import\s+"
+    rf"(?:\*|\(\s*{_IMPORT_NAME}(?:\s*,\s*{_IMPORT_NAME})*\s*,?\s*\)|{_IMPORT_NAME}(?:\s*,\s*{_IMPORT_NAME})*)"
+    rf")\s*"
+)
+
+
+def _normalize_imports(import_stmt: str, tool_name: str) -> Iterator[str]:
+    """Validate a custom tool import line and yield each statement with its whitespace collapsed."""
+    # Imports hold no string literals, so everything after "#" on a line is a comment
+    code = "\n".join(line.split("#", 1)[0] for line in import_stmt.splitlines())
+    
+    # "import os; import re" is two statements; empty pieces come from a trailing ";"
+    for statement in code.split(";"):
+        if not statement.strip():
+            continue
+        if not _IMPORT_RE.fullmatch(statement):
+            raise ValueError(f"Invalid import statement for tool '{tool_name}': {import_stmt!r}")
+        yield " ".join(statement.split())
+
+
+# (import statement, tool name) emitted for each builtin tool, keyed by BuiltinToolType value
+# (a str-based enum member hashes and compares like its value)
+BUILTIN_TOOL_INFO = MappingProxyType({
+    "google_search": ("from google.adk.tools import google_search", "google_search"),
+    "url_context": ("from google.adk.tools import url_context", "url_context"),
+    "load_memory": ("from google.adk.tools import load_memory", "load_memory"),
+    "preload_memory": ("from google.adk.tools import preload_memory", "preload_memory"),
+    "load_artifacts": ("from google.adk.tools import load_artifacts", "load_artifacts"),
+    "transfer_to_agent": ("from google.adk.tools import transfer_to_agent", "transfer_to_agent"),
+    "get_user_choice": ("from google.adk.tools import get_user_choice", "get_user_choice"),
+    "exit_loop": ("from google.adk.tools import exit_loop", "exit_loop"),
+})
+
+# Single-field views kept for callers that only need one of the two
+BUILTIN_TOOL_IMPORTS = MappingProxyType({key: info[0] for key, info in BUILTIN_TOOL_INFO.items()})
+BUILTIN_TOOL_NAMES = MappingProxyType({key: info[1] for key, info in BUILTIN_TOOL_INFO.items()})
+
+
+class _FunctionCodeOptimizer(ast.NodeTransformer):
+    """Generation-time rewrites applied to custom function source.
+    
+    - arithmetic between numeric constants is folded
+    - if-statements on a constant test keep only the branch that runs, unless
+      the dead branch yields or awaits: that may be the only yield, and
+      dropping it would turn a generator or coroutine into a plain function
+    
+    Environment lookups are left alone: their values would end up in agent.py.
+    """
+    
+    _FOLDABLE_OPS = {
+        ast.Add: operator.add,
+        ast.Sub: operator.sub,
+        ast.Mult: operator.mul,
+        ast.Div: operator.truediv,
+        ast.FloorDiv: operator.floordiv,
+        ast.Mod: operator.mod,
+    }
+    
+    def __init__(self):
+        # Set once a rewrite happens; untouched source is emitted as written
+        self.changed = False
+    
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        self.generic_visit(node)
+        fold = self._FOLDABLE_OPS.get(type(node.op))
+        if (
+            fold
+            and isinstance(node.left, ast.Constant) and isinstance(node.right, ast.Constant)
+            and type(node.left.value) in (int, float) and type(node.right.value) in (int, float)
+        ):
+            try:
+                value = fold(node.left.value, node.right.value)
+            except ArithmeticError:
+                # Keep the expression so the error still surfaces at runtime
+                return node
+            self.changed = True
+            return ast.copy_location(ast.Constant(value=value), node)
+        return node
+    
+    _SUSPENDING_NODES = (ast.Yield, ast.YieldFrom, ast.Await)
+    
+    def visit_If(self, node: ast.If) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.test, ast.Constant):
+            dead_branch = node.orelse if node.test.value else node.body
+            if any(
+                isinstance(child, self._SUSPENDING_NODES)
+                for statement in dead_branch
+                for child in ast.walk(statement)
+            ):
+                return node
+            self.changed = True
+            # The returned statements are spliced into the enclosing block
+            return node.body if node.test.value else node.orelse
+        return node
+    
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        node = super().generic_visit(node)
+        # Dropping a dead branch can leave a block empty, which is not valid Python
+        body = getattr(node, "body", None)
+        if isinstance(body, list) and not body:
+            body.append(ast.Pass())
+        return node
 
 
 class AgentCodeGenerator:
     """Generates Python agent code from configuration."""
     
-    def __init__(self):
-        self.builtin_tool_imports = {
-            BuiltinToolType.GOOGLE_SEARCH: "from google.adk.tools import google_search",
-            BuiltinToolType.URL_CONTEXT: "from google.adk.tools import url_context", 
-            BuiltinToolType.LOAD_MEMORY: "from google.adk.tools import load_memory",
-            BuiltinToolType.PRELOAD_MEMORY: "from google.adk.tools import preload_memory",
-            BuiltinToolType.LOAD_ARTIFACTS: "from google.adk.tools import load_artifacts",
-            BuiltinToolType.TRANSFER_TO_AGENT: "from google.adk.tools import transfer_to_agent",
-            BuiltinToolType.GET_USER_CHOICE: "from google.adk.tools import get_user_choice",
-            BuiltinToolType.EXIT_LOOP: "from google.adk.tools import exit_loop",
-        }
-        
-        self.builtin_tool_names = {
-            BuiltinToolType.GOOGLE_SEARCH: "google_search",
-            BuiltinToolType.URL_CONTEXT: "url_context",
-            BuiltinToolType.LOAD_MEMORY: "load_memory", 
-            BuiltinToolType.PRELOAD_MEMORY: "preload_memory",
-            BuiltinToolType.LOAD_ARTIFACTS: "load_artifacts",
-            BuiltinToolType.TRANSFER_TO_AGENT: "transfer_to_agent",
-            BuiltinToolType.GET_USER_CHOICE: "get_user_choice",
-            BuiltinToolType.EXIT_LOOP: "exit_loop",
-        }
+    # Read-only lookup tables shared by every instance
+    builtin_tool_info = BUILTIN_TOOL_INFO
+    builtin_tool_imports = BUILTIN_TOOL_IMPORTS
+    builtin_tool_names = BUILTIN_TOOL_NAMES
     
     def generate_from_config(self, config: AgentProjectConfig, output_dir: str = None) -> Dict[str, str]:
         """
@@ -89,7 +264,8 @@ class AgentCodeGenerator:
         
         # Write files to disk if output_dir is specified
         if output_dir:
-            self._write_files_to_disk(files, output_dir)
+            for file_path in self._write_files_to_disk(files, output_dir):
+                print(f"Generated: {file_path}")
         
         return files
     
@@ -106,20 +282,7 @@ class AgentCodeGenerator:
         agent_definitions = self._generate_agent_definitions(config)
         
         # Combine into final file
-        content = f"""# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     http://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-
+        return f"""{LICENSE_HEADER}
 \"\"\"
 {config.project_name}: {config.description}
 Generated by ADK Agent Generator
@@ -135,105 +298,130 @@ Generated by ADK Agent Generator
 # Main agent (entry point)
 root_agent = {config.main_agent}
 """
-        return content
-    
-    def _collect_imports(self, config: AgentProjectConfig) -> List[str]:
-        """Collect all necessary imports."""
-        imports = set()
-        
-        # Base imports
-        imports.add("from google.adk.agents.llm_agent import LlmAgent")
-        imports.add("from google.adk.agents.sequential_agent import SequentialAgent") 
-        imports.add("from google.adk.agents.parallel_agent import ParallelAgent")
-        imports.add("from google.adk.agents.loop_agent import LoopAgent")
-        imports.add("from google.adk.tools.function_tool import FunctionTool")
-        imports.add("from google.genai import types")
-        
-        # Add typing imports if we have custom functions
-        has_custom_functions = any(
-            tool.type == "custom_function" for tool in config.tools.values()
-        )
-        if has_custom_functions:
-            imports.add("from typing import List, Dict, Any, Optional")
-        
-        # Collect custom tool imports
-        for tool in config.tools.values():
-            if tool.type == "custom_function" and tool.imports:
-                for import_stmt in tool.imports:
-                    imports.add(import_stmt.strip())
-        
-        # Collect builtin tool imports
-        for tool in config.tools.values():
-            if tool.type == "builtin" and tool.builtin_type:
-                import_stmt = self.builtin_tool_imports.get(tool.builtin_type)
-                if import_stmt:
-                    imports.add(import_stmt)
-        
-        return sorted(list(imports))
     
     def _generate_custom_functions(self, config: AgentProjectConfig) -> str:
         """Generate custom function definitions."""
         custom_functions = []
         
-        for tool_name, tool in config.tools.items():
+        for tool in config.tools.values():
             if tool.type == "custom_function" and tool.function_code:
-                # Ensure proper indentation and formatting
-                function_code = tool.function_code.strip()
                 custom_functions.append(f"# Tool: {tool.description}")
-                custom_functions.append(function_code)
+                custom_functions.append(self._prepare_function_code(tool.function_code, config))
                 custom_functions.append("")  # Empty line separator
         
         return "\n".join(custom_functions)
     
+    def _prepare_function_code(self, function_code: str, config: AgentProjectConfig) -> str:
+        """Return the function source to embed, optimized if the config asks for it."""
+        function_code = function_code.strip()
+        if not config.optimize_custom_functions:
+            return function_code
+        
+        try:
+            tree = ast.parse(function_code)
+        except SyntaxError:
+            # Leave invalid code untouched so the user sees their own source in agent.py
+            return function_code
+        
+        optimizer = _FunctionCodeOptimizer()
+        tree = optimizer.visit(tree)
+        if not optimizer.changed:
+            # Nothing to rewrite - keep the user's comments and formatting
+            return function_code
+        # ast.unparse keeps docstrings but drops comments
+        return ast.unparse(ast.fix_missing_locations(tree))
+    
+    def _collect_imports(self, config: AgentProjectConfig) -> List[str]:
+        """Collect all necessary imports."""
+        imports = set(BASE_IMPORTS)
+        has_custom_functions = False
+        
+        # Collect custom and builtin tool imports in one pass
+        for tool in config.tools.values():
+            tool_type = tool.type
+            if tool_type == "custom_function":
+                has_custom_functions = True
+                if tool.imports:
+                    imports.update(
+                        statement
+                        for import_stmt in tool.imports
+                        for statement in _normalize_imports(import_stmt, tool.name)
+                    )
+            elif tool_type == "builtin" and tool.builtin_type:
+                info = self.builtin_tool_info.get(tool.builtin_type)
+                if info:
+                    imports.add(info[0])
+        
+        # Add typing imports if we have custom functions
+        if has_custom_functions:
+            imports.add("from typing import List, Dict, Any, Optional")
+        
+        return sorted(imports)
+    
     def _generate_agent_definitions(self, config: AgentProjectConfig) -> str:
         """Generate agent definitions in dependency order."""
-        agent_definitions = []
-        
         # Sort agents by dependency (sub-agents first)
         sorted_agents = self._sort_agents_by_dependency(config)
         
-        for agent_name in sorted_agents:
-            agent = config.agents[agent_name]
-            agent_code = self._generate_single_agent(agent_name, agent, config)
-            agent_definitions.append(agent_code)
+        def render(agent_name: str) -> str:
+            return self._generate_single_agent(agent_name, config.agents[agent_name], config)
+        
+        if len(sorted_agents) <= 1 or not _render_in_parallel():
+            blocks = [render(agent_name) for agent_name in sorted_agents]
+        else:
+            # Blocks render independently; only their concatenation has to follow the sort,
+            # and map() yields results in submission order
+            blocks = _get_render_pool().map(render, sorted_agents)
+        
+        agent_definitions = []
+        for block in blocks:
+            agent_definitions.append(block)
             agent_definitions.append("")  # Empty line separator
         
         return "\n".join(agent_definitions)
     
     def _sort_agents_by_dependency(self, config: AgentProjectConfig) -> List[str]:
-        """Sort agents so sub-agents are defined before their parents."""
+        """Sort agents so sub-agents are defined before their parents.
+        
+        Uses Kahn's algorithm: each agent waits on its sub-agents, and an agent
+        becomes ready once all of them have been emitted. Ties keep the order the
+        agents appear in the config, so the output is deterministic.
+        """
         sorted_agents = []
-        remaining = set(config.agents.keys())
-        
-        while remaining:
-            # Find agents with no unresolved dependencies
-            ready = []
-            for agent_name in remaining:
-                agent = config.agents[agent_name]
-                if all(sub_agent in sorted_agents for sub_agent in agent.sub_agents):
-                    ready.append(agent_name)
-            
-            if not ready:
-                # Circular dependency or other issue - just add remaining in arbitrary order
-                ready = list(remaining)
-            
-            # Add ready agents
-            for agent_name in ready:
-                sorted_agents.append(agent_name)
-                remaining.remove(agent_name)
+        
+        # Number of sub-agents each agent still waits on, and who waits on each agent
+        indegree = {name: len(agent.sub_agents) for name, agent in config.agents.items()}
+        parents = defaultdict(list)
+        for name, agent in config.agents.items():
+            for sub_agent in agent.sub_agents:
+                parents[sub_agent].append(name)
+        
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        while ready:
+            agent_name = ready.popleft()
+            sorted_agents.append(agent_name)
+            for parent in parents[agent_name]:
+                indegree[parent] -= 1
+                if indegree[parent] == 0:
+                    ready.append(parent)
+        
+        if len(sorted_agents) < len(indegree):
+            # Circular dependency or unknown sub-agent - just add the rest in config order
+            emitted = set(sorted_agents)
+            sorted_agents.extend(name for name in indegree if name not in emitted)
         
         return sorted_agents
     
     def _generate_single_agent(self, agent_name: str, agent: AgentConfig, config: AgentProjectConfig) -> str:
         """Generate code for a single agent."""
         
-        if agent.type == AgentType.LLM_AGENT:
+        if agent.type == "llm_agent":
             return self._generate_llm_agent(agent_name, agent, config)
-        elif agent.type == AgentType.SEQUENTIAL_AGENT:
+        elif agent.type == "sequential_agent":
             return self._generate_sequential_agent(agent_name, agent, config)
-        elif agent.type == AgentType.PARALLEL_AGENT:
+        elif agent.type == "parallel_agent":
             return self._generate_parallel_agent(agent_name, agent, config)
-        elif agent.type == AgentType.LOOP_AGENT:
+        elif agent.type == "loop_agent":
             return self._generate_loop_agent(agent_name, agent, config)
         else:
             raise ValueError(f"Unknown agent type: {agent.type}")
@@ -242,7 +430,7 @@ root_agent = {config.main_agent}
         """Generate LLM agent code."""
         
         # Build tools list
-        tools_list = self._build_tools_list(agent.tools, config)
+        tools_list = ", ".join(self._build_tools_list(agent.tools, config))
         
         # Build sub-agents list
         sub_agents_list = ", ".join(agent.sub_agents) if agent.sub_agents else None
@@ -253,12 +441,12 @@ root_agent = {config.main_agent}
         code = f"""# {agent.description}
 {agent_name} = LlmAgent(
     name="{agent_name}",
-    model="{agent.model or 'gemini-2.0-flash-lite-001'}",
+    model="{agent.model or DEFAULT_MODEL}",
     description=\"\"\"
     {agent.description}
     \"\"\",
     instruction=\"\"\"
-    {agent.instruction or 'You are a helpful AI assistant.'}
+    {agent.instruction or DEFAULT_INSTRUCTION}
     \"\"\""""
         
         if tools_list:
@@ -276,102 +464,76 @@ root_agent = {config.main_agent}
     
     def _generate_sequential_agent(self, agent_name: str, agent: AgentConfig, config: AgentProjectConfig) -> str:
         """Generate Sequential agent code."""
-        sub_agents_list = ", ".join(agent.sub_agents)
-        
-        return f"""# {agent.description}
-{agent_name} = SequentialAgent(
-    name="{agent_name}",
-    description=\"\"\"
-    {agent.description}
-    \"\"\",
-    sub_agents=[{sub_agents_list}]
-)"""
+        return self._generate_workflow_agent("SequentialAgent", agent_name, agent, agent.sub_agents)
     
     def _generate_parallel_agent(self, agent_name: str, agent: AgentConfig, config: AgentProjectConfig) -> str:
         """Generate Parallel agent code."""
-        sub_agents_list = ", ".join(agent.sub_agents)
-        
-        return f"""# {agent.description}
-{agent_name} = ParallelAgent(
-    name="{agent_name}",
-    description=\"\"\"
-    {agent.description}
-    \"\"\",
-    sub_agents=[{sub_agents_list}]
-)"""
-    
-
+        return self._generate_workflow_agent("ParallelAgent", agent_name, agent, agent.sub_agents)
     
     def _generate_loop_agent(self, agent_name: str, agent: AgentConfig, config: AgentProjectConfig) -> str:
         """Generate Loop agent code."""
         sub_agent = agent.sub_agents[0] if agent.sub_agents else "None"
+        return self._generate_workflow_agent("LoopAgent", agent_name, agent, [sub_agent])
+    
+    def _generate_workflow_agent(self, agent_class: str, agent_name: str, agent: AgentConfig, sub_agents: List[str]) -> str:
+        """Generate code for a workflow agent (Sequential/Parallel/Loop)."""
+        sub_agents_list = ", ".join(sub_agents)
         
         return f"""# {agent.description}
-{agent_name} = LoopAgent(
+{agent_name} = {agent_class}(
     name="{agent_name}",
     description=\"\"\"
     {agent.description}
     \"\"\",
-    sub_agents=[{sub_agent}]
+    sub_agents=[{sub_agents_list}]
 )"""
     
-    def _build_tools_list(self, tool_names: List[str], config: AgentProjectConfig) -> str:
+    def _build_tools_list(self, tool_names: List[str], config: AgentProjectConfig) -> List[str]:
         """Build the tools list for an agent."""
         tools = []
+        config_tools = config.tools
+        builtin_tool_info = self.builtin_tool_info
         
         for tool_name in tool_names:
-            tool = config.tools.get(tool_name)
+            tool = config_tools.get(tool_name)
             if not tool:
                 continue
             
-            if tool.type == "builtin" and tool.builtin_type:
-                builtin_name = self.builtin_tool_names.get(tool.builtin_type)
-                if builtin_name:
-                    tools.append(builtin_name)
-            elif tool.type == "custom_function":
+            tool_type = tool.type
+            if tool_type == "builtin" and tool.builtin_type:
+                info = builtin_tool_info.get(tool.builtin_type)
+                if info:
+                    tools.append(info[1])
+            elif tool_type == "custom_function":
                 tools.append(f"FunctionTool({tool_name})")
         
-        return ", ".join(tools)
+        return tools
     
     def _build_agent_config(self, agent: AgentConfig) -> str:
         """Build agent configuration parameters."""
         config_parts = []
+        agent_config = agent.config
         
         # Add common config options
-        if agent.config.get("temperature") is not None:
-            temp = agent.config["temperature"]
+        if agent_config.get("temperature") is not None:
+            temp = agent_config["temperature"]
             config_parts.append(f'    generate_content_config=types.GenerateContentConfig(temperature={temp})')
         
-        if agent.config.get("disallow_transfer_to_parent"):
+        if agent_config.get("disallow_transfer_to_parent"):
             config_parts.append("    disallow_transfer_to_parent=True")
         
-        if agent.config.get("disallow_transfer_to_peers"):
+        if agent_config.get("disallow_transfer_to_peers"):
             config_parts.append("    disallow_transfer_to_peers=True")
         
-        if agent.config.get("output_key"):
-            output_key = agent.config["output_key"]
+        if agent_config.get("output_key"):
+            output_key = agent_config["output_key"]
             config_parts.append(f'    output_key="{output_key}"')
         
         return ",\n".join(config_parts)
     
     def _generate_init_file(self) -> str:
         """Generate __init__.py file."""
-        return """# Copyright 2025 Google LLC
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     http://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-
-# Generated agent package
-"""
+        return INIT_FILE_CONTENT
     
     def _generate_requirements_file(self, config: AgentProjectConfig) -> str:
         """Generate requirements.txt file."""
@@ -435,7 +597,8 @@ This agent was automatically generated using the ADK Agent Generator.
         """Generate agent documentation for README."""
         docs = []
         for agent_name, agent in config.agents.items():
-            docs.append(f"- **{agent_name}** ({agent.type}): {agent.description}")
+            # .value keeps the f-string from rendering the enum as "AgentType.LLM_AGENT"
+            docs.append(f"- **{agent_name}** ({agent.type.value}): {agent.description}")
         return "\n".join(docs)
     
     def _generate_tool_docs(self, config: AgentProjectConfig) -> str:
@@ -465,15 +628,105 @@ This agent was automatically generated using the ADK Agent Generator.
             lines.append(f"{key}={value}")
         return "\n".join(lines)
     
-    def _write_files_to_disk(self, files: Dict[str, str], output_dir: str):
-        """Write generated files to disk."""
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+    def write_to_disk(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        output_dir: str,
+        executable: FrozenSet[str] = frozenset()
+    ) -> List[str]:
+        """
+        Write files produced by generate_from_config to a directory.
+        
+        Lets callers that already hold the generated files write them without
+        generating them again. Nothing is printed, so it is safe to call from
+        worker threads; callers report the returned paths themselves. A Python
+        file that fails to byte-compile is still written, and the failure is
+        reported with warnings.warn (RuntimeWarning).
         
+        Args:
+            files: Dictionary mapping filename to file content, as text or
+                already-encoded UTF-8 bytes
+            output_dir: Directory to write files to
+            executable: Filenames to create with mode 0o755 instead of 0o644
+            
+        Returns:
+            Paths of the written files, in the order of files
+        """
+        return self._write_files_to_disk(files, output_dir, executable)
+    
+    def _write_files_to_disk(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        output_dir: str,
+        executable: FrozenSet[str] = frozenset()
+    ) -> List[str]:
+        """Write generated files to disk and return their paths."""
+        # Plain string paths avoid building a PurePath per file
+        output_path = os.fspath(output_dir)
+        
+        if os.path.isdir(output_path):
+            self._write_files(files, output_path, executable)
+        else:
+            # A new directory is staged beside its target and renamed into place,
+            # so an interrupted run never leaves a half-written agent behind
+            parent = os.path.dirname(os.path.abspath(output_path))
+            os.makedirs(parent, exist_ok=True)
+            scratch = tempfile.mkdtemp(prefix=".adk_codegen-", dir=parent)
+            try:
+                self._write_files(files, scratch, executable)
+                os.chmod(scratch, 0o755)
+                os.replace(scratch, output_path)
+            except OSError:
+                # Target appeared meanwhile - fall back to writing into it directly
+                shutil.rmtree(scratch, ignore_errors=True)
+                os.makedirs(output_path, exist_ok=True)
+                self._write_files(files, output_path, executable)
+        
+        # Byte-compile the Python files up front so the first import of the agent skips it
+        for filename in files:
+            if filename.endswith(".py"):
+                self._precompile(os.path.join(output_path, filename))
+        
+        return [os.path.join(output_path, filename) for filename in files]
+    
+    def _write_files(
+        self,
+        files: Dict[str, Union[str, bytes]],
+        directory: str,
+        executable: FrozenSet[str] = frozenset()
+    ):
+        """Write each generated file into an existing directory."""
+        # Raw descriptors skip the buffered text-file wrapper write_text builds per file
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
         for filename, content in files.items():
-            file_path = output_path / filename
-            file_path.write_text(content, encoding='utf-8')
-            print(f"Generated: {file_path}")
+            data = memoryview(content if isinstance(content, bytes) else content.encode('utf-8'))
+            # The mode is applied on create, so no separate chmod is needed
+            mode = 0o755 if filename in executable else 0o644
+            fd = os.open(os.path.join(directory, filename), flags, mode)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+    
+    def _precompile(self, file_path: str):
+        """Write __pycache__ entries for a generated module at each optimization level."""
+        for optimize in PRECOMPILE_OPTIMIZE_LEVELS:
+            try:
+                py_compile.compile(file_path, optimize=optimize, doraise=True)
+            except py_compile.PyCompileError as e:
+                # The source is still written; Python reports the error again when it is run
+                warnings.warn(f"could not byte-compile {file_path}: {e.msg}", RuntimeWarning)
+                return
+
+
+def _config_schema():
+    """Import the Pydantic config schema on first use."""
+    try:
+        from . import config_schema
+    except ImportError:
+        import config_schema
+    return config_schema
 
 
 def generate_agent_from_config_file(config_file: str, output_dir: str = None) -> Dict[str, str]:
@@ -487,25 +740,50 @@ def generate_agent_from_config_file(config_file: str, output_dir: str = None) ->
     Returns:
         Dictionary mapping filename to file content
     """
-    with open(config_file, 'r') as f:
-        config_data = json.load(f)
-    
-    config = AgentProjectConfig(**config_data)
+    st = os.stat(config_file)
+    config = _load_config_cached(os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
     generator = AgentCodeGenerator()
     return generator.generate_from_config(config, output_dir)
 
 
-def generate_agent_from_dict(config_dict: dict, output_dir: str = None) -> Dict[str, str]:
+@functools.lru_cache(maxsize=64)
+def _load_config_cached(config_file: str, mtime_ns: int, size: int) -> AgentProjectConfig:
+    """
+    Parse and validate a configuration file, memoized on its path and stat.
+    
+    The modification time and size are part of the key, so editing the file
+    invalidates the cached entry. Callers share the returned config and must
+    not mutate it. The raw bytes go straight to pydantic-core's JSON parser,
+    so no intermediate Python dict is built.
+    
+    Args:
+        config_file: Absolute path to JSON configuration file
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+        
+    Returns:
+        The validated project configuration
+    """
+    with open(config_file, 'rb') as f:
+        raw = f.read()
+    
+    return _config_schema().AgentProjectConfig.model_validate_json(raw)
+
+
+def generate_agent_from_dict(config_dict: dict, output_dir: str = None,
+                             generator: AgentCodeGenerator = None) -> Dict[str, str]:
     """
     Generate agent code from a configuration dictionary.
     
     Args:
         config_dict: Configuration dictionary
         output_dir: Optional output directory
+        generator: Optional generator to reuse across calls
         
     Returns:
         Dictionary mapping filename to file content
     """
-    config = AgentProjectConfig(**config_dict)
-    generator = AgentCodeGenerator()
+    config = _config_schema().AgentProjectConfig.model_validate(config_dict)
+    if generator is None:
+        generator = AgentCodeGenerator()
     return generator.generate_from_config(config, output_dir) 
\ No newline at end of file
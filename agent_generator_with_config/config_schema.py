@@ -17,7 +17,7 @@ JSON Schema definitions for ADK Agent Configuration.
 Based on analysis of existing ADK agents, tools, and planners.
 """
 
-from typing import Dict, List, Optional, Union, Any, Literal
+from typing import Dict, Iterator, List, Optional, Union, Any, Literal
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
 
@@ -98,50 +98,59 @@ class AgentProjectConfig(BaseModel):
     requirements: List[str] = Field(default_factory=list, description="Python dependencies")
     environment_variables: Dict[str, str] = Field(default_factory=dict, description="Environment variables with actual values (will be written to .env file)")
     environment_variables_example: Dict[str, str] = Field(default_factory=dict, description="Environment variables with example/placeholder values (will be written to .env.example file)")
+    
+    # Code generation options
+    optimize_custom_functions: bool = Field(default=False, description="Rewrite custom function code at generation time: fold constant arithmetic and drop constant if-branches (rewritten functions lose their comments)")
 
 
 # Validation functions
-def validate_agent_config(config: AgentProjectConfig) -> List[str]:
-    """Validate agent configuration and return list of errors."""
-    errors = []
+def validate_agent_config_iter(config: AgentProjectConfig) -> Iterator[str]:
+    """
+    Yield validation errors for an agent configuration as they are found.
     
+    Callers that only need to know whether a config is valid can stop at the
+    first error instead of walking the whole config.
+    """
     # Check main agent exists
     if config.main_agent not in config.agents:
-        errors.append(f"Main agent '{config.main_agent}' not found in agents")
+        yield f"Main agent '{config.main_agent}' not found in agents"
     
     # Check all referenced sub-agents exist
     for agent_name, agent in config.agents.items():
         for sub_agent in agent.sub_agents:
             if sub_agent not in config.agents:
-                errors.append(f"Sub-agent '{sub_agent}' referenced by '{agent_name}' not found")
+                yield f"Sub-agent '{sub_agent}' referenced by '{agent_name}' not found"
     
     # Check all referenced tools exist
     for agent_name, agent in config.agents.items():
         for tool_name in agent.tools:
             if tool_name not in config.tools:
-                errors.append(f"Tool '{tool_name}' referenced by '{agent_name}' not found")
+                yield f"Tool '{tool_name}' referenced by '{agent_name}' not found"
     
     # Validate agent types have required fields
     for agent_name, agent in config.agents.items():
         if agent.type == AgentType.LLM_AGENT:
             if not agent.model:
-                errors.append(f"LLM agent '{agent_name}' missing required 'model' field")
+                yield f"LLM agent '{agent_name}' missing required 'model' field"
             if not agent.instruction:
-                errors.append(f"LLM agent '{agent_name}' missing required 'instruction' field")
+                yield f"LLM agent '{agent_name}' missing required 'instruction' field"
         
         # Sequential/Parallel/Loop agents need sub-agents
         if agent.type in [AgentType.SEQUENTIAL_AGENT, AgentType.PARALLEL_AGENT, AgentType.LOOP_AGENT]:
             if not agent.sub_agents:
-                errors.append(f"{agent.type} agent '{agent_name}' needs at least one sub-agent")
+                yield f"{agent.type} agent '{agent_name}' needs at least one sub-agent"
     
     # Validate tool configurations
     for tool_name, tool in config.tools.items():
         if tool.type == "builtin" and not tool.builtin_type:
-            errors.append(f"Builtin tool '{tool_name}' missing builtin_type")
+            yield f"Builtin tool '{tool_name}' missing builtin_type"
         if tool.type == "custom_function" and not tool.function_code:
-            errors.append(f"Custom tool '{tool_name}' missing function_code")
-    
-    return errors
+            yield f"Custom tool '{tool_name}' missing function_code"
+
+
+def validate_agent_config(config: AgentProjectConfig) -> List[str]:
+    """Validate agent configuration and return list of errors."""
+    return list(validate_agent_config_iter(config))
 
 
 def get_default_model() -> str:
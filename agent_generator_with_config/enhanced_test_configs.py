@@ -18,8 +18,66 @@ Enhanced test configurations demonstrating new features:
 2. Environment variables with actual and example values
 """
 
+import string
+import textwrap
+
 from config_schema import AgentProjectConfig
 
+# Shared skeleton for custom tools that GET a URL and post-process the response
+_HTTP_TOOL_TEMPLATE = string.Template('''$preamble
+
+def $signature:
+    """$docstring"""
+    try:
+$setup        response = $session.get($request_args)
+        response.raise_for_status()
+        
+$parse
+    except Exception as e:
+        return f"Error $action: {str(e)}"''')
+
+# Session shared by the scraping tools; each tool carries it so it also works on its own,
+# and the guard keeps agent.py from building it a second time when both tools are present
+_SCRAPER_SESSION = """# Pooled connections, shared by the scraping tools
+if "_HTTP_SESSION" not in globals():
+    _HTTP_SESSION = requests.Session()
+    _HTTP_SESSION.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })"""
+
+
+def _http_tool(signature, docstring, action, preamble, parse, setup="",
+               session="_HTTP_SESSION", request_args="url, timeout=10"):
+    """Build a custom tool's function_code from the shared HTTP skeleton.
+    
+    Args:
+        signature: Function name and parameters, e.g. "fetch_data(url: str) -> str"
+        docstring: One-line docstring of the generated function
+        action: Wording for the error message ("Error <action>: ...")
+        preamble: Module-level code emitted above the function (session setup)
+        parse: Statements run on a successful response
+        setup: Statements run inside the try block before the request
+        session: Name of the session object the request goes through
+        request_args: Arguments passed to session.get()
+        
+    Returns:
+        The function_code string
+    """
+    def block(code):
+        return textwrap.indent(textwrap.dedent(code).strip("\n"), " " * 8)
+    
+    return _HTTP_TOOL_TEMPLATE.substitute(
+        preamble=preamble.strip("\n") + "\n",
+        signature=signature,
+        docstring=docstring,
+        setup=block(setup) + "\n        \n" if setup else "",
+        session=session,
+        request_args=request_args,
+        parse=block(parse),
+        action=action,
+    )
+
+
 # Enhanced configuration with custom imports and dependencies
 enhanced_custom_tool_config = {
     "project_name": "enhanced_data_processor",
@@ -45,19 +103,23 @@ enhanced_custom_tool_config = {
             "description": "Fetch data from a URL using requests",
             "imports": [
                 "import requests",
-                "import json"
+                "import orjson"
             ],
             "dependencies": [
-                "requests>=2.31.0"
+                "requests>=2.31.0",
+                "orjson>=3.9.0"
             ],
-            "function_code": """def fetch_data(url: str) -> str:
-    \"\"\"Fetch data from a URL.\"\"\"
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return json.dumps(response.json(), indent=2)
-    except Exception as e:
-        return f"Error fetching data: {str(e)}\""""
+            "function_code": _http_tool(
+                "fetch_data(url: str) -> str",
+                "Fetch data from a URL.",
+                action="fetching data",
+                preamble="""# Pooled connections, reused across calls to the same host
+_HTTP_SESSION = requests.Session()""",
+                parse="""
+                    # Parse the raw body bytes directly instead of decoding them to text first
+                    return orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode()
+                """,
+            )
         },
         
         "analyze_data": {
@@ -66,25 +128,42 @@ enhanced_custom_tool_config = {
             "description": "Analyze data using pandas",
             "imports": [
                 "import pandas as pd",
-                "import json"
+                "import orjson"
             ],
             "dependencies": [
-                "pandas>=2.0.0"
+                "pandas>=2.0.0",
+                "orjson>=3.9.0"
             ],
             "function_code": """def analyze_data(data_json: str) -> str:
     \"\"\"Analyze JSON data using pandas.\"\"\"
     try:
-        data = json.loads(data_json)
-        df = pd.DataFrame(data)
+        data = orjson.loads(data_json)
+        
+        # Flat records get their shape and columns without pandas
+        if isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            cols = list(dict.fromkeys(key for row in data for key in row))
+            if not cols:
+                return orjson.dumps(
+                    {"shape": (len(data), 0), "columns": [], "dtypes": {}, "summary": "No numeric columns"},
+                    option=orjson.OPT_INDENT_2,
+                ).decode()
+            df = pd.DataFrame.from_records(data, columns=cols)
+        else:
+            df = pd.DataFrame(data)
         
+        numeric = df.select_dtypes(include='number')
         analysis = {
             "shape": df.shape,
             "columns": list(df.columns),
             "dtypes": df.dtypes.to_dict(),
-            "summary": df.describe().to_dict() if df.select_dtypes(include='number').shape[1] > 0 else "No numeric columns"
+            "summary": numeric.describe().to_dict() if numeric.shape[1] > 0 else "No numeric columns"
         }
         
-        return json.dumps(analysis, indent=2, default=str)
+        return orjson.dumps(
+            analysis,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode()
     except Exception as e:
         return f"Error analyzing data: {str(e)}\""""
         },
@@ -94,26 +173,39 @@ enhanced_custom_tool_config = {
             "type": "custom_function", 
             "description": "Export results to CSV using pandas",
             "imports": [
-                "import pandas as pd",
-                "import json",
+                "import csv",
+                "import orjson",
                 "from datetime import datetime",
                 "from typing import Optional"
             ],
             "dependencies": [
-                "pandas>=2.0.0"
+                "pandas>=2.0.0",
+                "orjson>=3.9.0"
             ],
             "function_code": """def export_results(data_json: str, filename: Optional[str] = None) -> str:
     \"\"\"Export data to CSV file.\"\"\"
     try:
-        data = json.loads(data_json)
-        df = pd.DataFrame(data)
+        data = orjson.loads(data_json)
         
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"export_{timestamp}.csv"
         
-        df.to_csv(filename, index=False)
-        return f"Data exported to {filename} successfully. Shape: {df.shape}"
+        # Flat records stream straight to CSV without building a DataFrame
+        if isinstance(data, list) and data and all(isinstance(row, dict) for row in data):
+            fieldnames = list(dict.fromkeys(key for row in data for key in row))
+            with open(filename, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
+            shape = (len(data), len(fieldnames))
+        else:
+            import pandas as pd
+            df = pd.DataFrame(data)
+            df.to_csv(filename, index=False)
+            shape = df.shape
+        
+        return f"Data exported to {filename} successfully. Shape: {shape}"
     except Exception as e:
         return f"Error exporting data: {str(e)}\""""
         }
@@ -169,29 +261,27 @@ web_scraper_config = {
                 "beautifulsoup4>=4.12.0",
                 "lxml>=4.9.0"
             ],
-            "function_code": """def scrape_page(url: str, selector: Optional[str] = None) -> str:
-    \"\"\"Scrape content from a web page.\"\"\"
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        if selector:
-            elements = soup.select(selector)
-            content = '\\n'.join([elem.get_text().strip() for elem in elements])
-        else:
-            content = soup.get_text()
-        
-        # Clean up whitespace
-        content = re.sub(r'\\s+', ' ', content).strip()
-        
-        return content[:5000]  # Limit to 5000 chars
-    except Exception as e:
-        return f"Error scraping page: {str(e)}\""""
+            "function_code": _http_tool(
+                "scrape_page(url: str, selector: Optional[str] = None) -> str",
+                "Scrape content from a web page.",
+                action="scraping page",
+                preamble=_SCRAPER_SESSION + """
+_WS_RE = re.compile(r'\\s+')""",
+                parse="""
+                    soup = BeautifulSoup(response.content, 'lxml')
+                    
+                    if selector:
+                        elements = soup.select(selector)
+                        content = '\\n'.join([elem.get_text().strip() for elem in elements])
+                    else:
+                        content = soup.get_text()
+                    
+                    # Clean up whitespace
+                    content = _WS_RE.sub(' ', content).strip()
+                    
+                    return content[:5000]  # Limit to 5000 chars
+                """,
+            )
         },
         
         "extract_links": {
@@ -205,36 +295,34 @@ web_scraper_config = {
             ],
             "dependencies": [
                 "requests>=2.31.0",
-                "beautifulsoup4>=4.12.0"
+                "beautifulsoup4>=4.12.0",
+                "lxml>=4.9.0"
             ],
-            "function_code": """def extract_links(url: str, internal_only: bool = False) -> str:
-    \"\"\"Extract all links from a web page.\"\"\"
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        base_domain = urlparse(url).netloc
-        
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(url, href)
-            
-            if internal_only and urlparse(full_url).netloc != base_domain:
-                continue
-                
-            links.append({
-                'text': link.get_text().strip()[:100],
-                'url': full_url
-            })
-        
-        return str(links[:50])  # Limit to 50 links
-    except Exception as e:
-        return f"Error extracting links: {str(e)}\""""
+            "function_code": _http_tool(
+                "extract_links(url: str, internal_only: bool = False) -> str",
+                "Extract all links from a web page.",
+                action="extracting links",
+                preamble=_SCRAPER_SESSION,
+                parse="""
+                    soup = BeautifulSoup(response.content, 'lxml')
+                    base_domain = urlparse(url).netloc
+                    
+                    links = []
+                    for link in soup.find_all('a', href=True):
+                        href = link['href']
+                        full_url = urljoin(url, href)
+                        
+                        if internal_only and urlparse(full_url).netloc != base_domain:
+                            continue
+                            
+                        links.append({
+                            'text': link.get_text().strip()[:100],
+                            'url': full_url
+                        })
+                    
+                    return str(links[:50])  # Limit to 50 links
+                """,
+            )
         },
         
         "save_content": {
@@ -329,29 +417,38 @@ workflow_config = {
             "description": "Fetch data from API with authentication",
             "imports": [
                 "import requests",
-                "import os"
+                "import os",
+                "from requests.adapters import HTTPAdapter",
+                "from urllib3.util.retry import Retry"
             ],
             "dependencies": [
                 "requests>=2.31.0"
             ],
-            "function_code": """def fetch_api_data(endpoint: str) -> str:
-    \"\"\"Fetch data from API using environment variables for auth.\"\"\"
-    try:
-        api_key = os.getenv('API_KEY')
-        base_url = os.getenv('API_BASE_URL', 'https://api.example.com')
-        
-        headers = {
-            'Authorization': f'Bearer {api_key}',
-            'Content-Type': 'application/json'
-        }
-        
-        url = f"{base_url}/{endpoint}"
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        return response.text
-    except Exception as e:
-        return f"Error fetching API data: {str(e)}\""""
+            "function_code": _http_tool(
+                "fetch_api_data(endpoint: str) -> str",
+                "Fetch data from API using environment variables for auth.",
+                action="fetching API data",
+                preamble="""# Pooled connections with retries on transient failures
+_API_SESSION = requests.Session()
+_API_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+_API_SESSION.mount('http://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))""",
+                setup="""
+                    api_key = os.getenv('API_KEY')
+                    base_url = os.getenv('API_BASE_URL', 'https://api.example.com')
+                    
+                    headers = {
+                        'Authorization': f'Bearer {api_key}',
+                        'Content-Type': 'application/json'
+                    }
+                    
+                    url = f"{base_url}/{endpoint}"
+                """,
+                session="_API_SESSION",
+                request_args="url, headers=headers, timeout=30",
+                parse="""
+                    return response.text
+                """,
+            )
         },
         
         "process_data": {
@@ -360,7 +457,8 @@ workflow_config = {
             "description": "Process data with configurable parameters",
             "imports": [
                 "import json",
-                "import os"
+                "import os",
+                "from itertools import islice"
             ],
             "function_code": """def process_data(raw_data: str) -> str:
     \"\"\"Process raw data using environment configuration.\"\"\"
@@ -374,8 +472,9 @@ workflow_config = {
         
         # Process data
         if isinstance(data, list):
+            # Filter while iterating instead of copying a max_records slice first
             processed = [
-                item for item in data[:max_records] 
+                item for item in islice(data, max_records)
                 if item.get(filter_field) == filter_value
             ]
         else:
@@ -391,15 +490,18 @@ workflow_config = {
             "type": "custom_function",
             "description": "Generate report with environment-based configuration",
             "imports": [
-                "import json",
+                "import orjson",
                 "import os",
                 "from datetime import datetime",
                 "from typing import Optional"
             ],
+            "dependencies": [
+                "orjson>=3.9.0"
+            ],
             "function_code": """def generate_report(processed_data: str) -> str:
     \"\"\"Generate report using environment settings.\"\"\"
     try:
-        data = json.loads(processed_data)
+        data = orjson.loads(processed_data)
         
         # Get report settings from environment
         report_format = os.getenv('REPORT_FORMAT', 'summary')
@@ -425,8 +527,8 @@ workflow_config = {
         filename = f"report_{timestamp}.json"
         filepath = os.path.join(output_dir, filename)
         
-        with open(filepath, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
         
         return f"Report generated: {filepath}"
     except Exception as e:
@@ -19,17 +19,38 @@ This creates a real agent that can be tested with the ADK CLI.
 
 import os
 import sys
-from pathlib import Path
+import json
+import hashlib
 
 # Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
 
-try:
-    from config_schema import AgentProjectConfig, validate_agent_config
-    from code_generator import generate_agent_from_dict
-except ImportError:
-    print("Error: Could not import modules. Make sure you're in the correct directory.")
-    sys.exit(1)
+
+def _lazy_imports():
+    """Import the schema and generator only when generation is requested."""
+    try:
+        from config_schema import AgentProjectConfig, validate_agent_config
+        from code_generator import AgentCodeGenerator
+    except ImportError:
+        print("Error: Could not import modules. Make sure you're in the correct directory.")
+        sys.exit(1)
+    return AgentProjectConfig, validate_agent_config, AgentCodeGenerator
+
+
+# Validated configs and their errors, keyed by a digest of the config's canonical JSON
+_VALIDATED_CONFIGS = {}
+
+
+def _validate_config(config_dict):
+    """Build and validate a config once per process; edits to the dict produce a new entry."""
+    AgentProjectConfig, validate_agent_config, _ = _lazy_imports()
+    key = hashlib.blake2b(json.dumps(config_dict, sort_keys=True).encode(), digest_size=16).digest()
+    cached = _VALIDATED_CONFIGS.get(key)
+    if cached is None:
+        config = AgentProjectConfig(**config_dict)
+        cached = _VALIDATED_CONFIGS[key] = (config, validate_agent_config(config))
+    return cached
 
 
 # Simple Test Agent Configuration (no external dependencies)
@@ -102,7 +123,18 @@ You have access to safe mathematical evaluation and basic statistics.""",
             "name": "calculator",
             "type": "custom_function",
             "description": "Safe mathematical expression evaluator",
-            "function_code": """def calculator(expression: str, tool_context: ToolContext) -> float:
+            "imports": [
+                "import ast",
+                "import operator",
+                "from functools import lru_cache"
+            ],
+            "function_code": """@lru_cache(maxsize=256)
+def _parse_expression(expression: str) -> ast.expr:
+    \"\"\"Parse an expression once; repeated expressions reuse the cached tree.\"\"\"
+    return ast.parse(expression, mode='eval').body
+
+
+def calculator(expression: str, tool_context: ToolContext) -> float:
     \"\"\"Safely evaluate a mathematical expression.
     
     Args:
@@ -112,9 +144,6 @@ You have access to safe mathematical evaluation and basic statistics.""",
     Returns:
         Result of the calculation
     \"\"\"
-    import ast
-    import operator
-    
     # Supported operations
     ops = {
         ast.Add: operator.add,
@@ -138,16 +167,16 @@ You have access to safe mathematical evaluation and basic statistics.""",
             raise TypeError(f"Unsupported operation: {type(node).__name__}")
     
     try:
-        tree = ast.parse(expression, mode='eval')
-        result = eval_expr(tree.body)
+        result = eval_expr(_parse_expression(expression))
         
         # Store in context
-        if 'calculations' not in tool_context.state:
-            tool_context.state['calculations'] = []
-        tool_context.state['calculations'].append({
+        history = tool_context.state.get('calculations', [])
+        history.append({
             'expression': expression,
             'result': result
         })
+        # Keep only the most recent entries so session state stays bounded
+        tool_context.state['calculations'] = history[-100:]
         
         return float(result)
     except Exception as e:
@@ -158,6 +187,9 @@ You have access to safe mathematical evaluation and basic statistics.""",
             "name": "statistics",
             "type": "custom_function",
             "description": "Basic statistical operations",
+            "imports": [
+                "import statistics as stats"
+            ],
             "function_code": """def statistics(numbers: List[float], operation: str, tool_context: ToolContext) -> float:
     \"\"\"Perform statistical operations on a list of numbers.
     
@@ -179,8 +211,8 @@ You have access to safe mathematical evaluation and basic statistics.""",
         raise ValueError("All values must be numeric")
     
     operations = {
-        'mean': lambda x: sum(x) / len(x),
-        'median': lambda x: sorted(x)[len(x)//2] if len(x) % 2 == 1 else (sorted(x)[len(x)//2-1] + sorted(x)[len(x)//2]) / 2,
+        'mean': stats.mean,
+        'median': stats.median,
         'sum': sum,
         'min': min,
         'max': max,
@@ -193,13 +225,14 @@ You have access to safe mathematical evaluation and basic statistics.""",
     result = operations[operation](nums)
     
     # Store in context
-    if 'statistics' not in tool_context.state:
-        tool_context.state['statistics'] = []
-    tool_context.state['statistics'].append({
+    history = tool_context.state.get('statistics', [])
+    history.append({
         'numbers': numbers,
         'operation': operation,
         'result': result
     })
+    # Keep only the most recent entries so session state stays bounded
+    tool_context.state['statistics'] = history[-100:]
     
     return float(result)"""
         }
@@ -264,13 +297,39 @@ Always cite your sources and provide links when possible.""",
 }
 
 
+def _gen_one(generator, agent_name, config_dict, test_dir):
+    """Validate and generate one test agent.
+    
+    Prints nothing; the caller reports the result.
+    
+    Returns:
+        Tuple of (validated, files, written paths, error message or None)
+    """
+    # Validate configuration
+    try:
+        config, errors = _validate_config(config_dict)
+    except Exception as e:
+        return False, None, None, f"❌ Configuration error: {str(e)}"
+    if errors:
+        return False, None, None, f"❌ Validation errors: {errors}"
+    
+    # Generate agent
+    try:
+        files = generator.generate_from_config(config)
+        written = generator.write_to_disk(files, os.path.join(test_dir, agent_name))
+    except Exception as e:
+        return True, None, None, f"❌ Generation failed: {str(e)}"
+    return True, files, written, None
+
+
 def generate_test_agents():
     """Generate test agents to validate functionality."""
+    _, _, AgentCodeGenerator = _lazy_imports()
+    generator = AgentCodeGenerator()
     
     # Create test directories
-    base_dir = Path(__file__).parent
-    test_dir = base_dir / "generated_test_agents"
-    test_dir.mkdir(exist_ok=True)
+    test_dir = os.path.join(BASE_DIR, "generated_test_agents")
+    os.makedirs(test_dir, exist_ok=True)
     
     agents = [
         ("simple_test_agent", TEST_AGENT_CONFIG),
@@ -278,45 +337,37 @@ def generate_test_agents():
         ("web_search_agent", WEB_SEARCH_AGENT_CONFIG),
     ]
     
-    for agent_name, config_dict in agents:
-        print(f"\n=== Generating {agent_name} ===")
+    # Generation is CPU-bound, so worker threads would only take turns on the GIL
+    results = [_gen_one(generator, agent_name, config_dict, test_dir) for agent_name, config_dict in agents]
+    
+    for (agent_name, _), (validated, files, written, error) in zip(agents, results):
+        # Each agent's report goes out in a single write
+        out = [f"\n=== Generating {agent_name} ==="]
         
-        # Validate configuration
-        try:
-            config = AgentProjectConfig(**config_dict)
-            errors = validate_agent_config(config)
-            
-            if errors:
-                print(f"❌ Validation errors: {errors}")
-                continue
-            else:
-                print("✅ Configuration validated")
-        except Exception as e:
-            print(f"❌ Configuration error: {str(e)}")
+        if validated:
+            out.append("✅ Configuration validated")
+        if error:
+            out.append(error)
+            sys.stdout.write("\n".join(out) + "\n")
             continue
         
-        # Generate agent
-        try:
-            agent_dir = test_dir / agent_name
-            files = generate_agent_from_dict(config_dict, str(agent_dir))
+        out.extend(f"Generated: {file_path}" for file_path in written)
+        agent_dir = os.path.join(test_dir, agent_name)
+        out.append(f"✅ Generated {len(files)} files to: {agent_dir}")
+        for filename in files.keys():
+            out.append(f"  - {filename}")
             
-            print(f"✅ Generated {len(files)} files to: {agent_dir}")
-            for filename in files.keys():
-                print(f"  - {filename}")
-                
-            # Print usage instructions
-            print(f"\n📋 To test this agent:")
-            print(f"   cd {agent_dir}")
-            if agent_name == "simple_test_agent":
-                print(f"   adk cli agent.py  # No setup required!")
-            elif agent_name == "custom_tool_test_agent":
-                print(f"   adk cli agent.py  # Custom tools work out of the box!")
-            else:
-                print(f"   # Set up environment variables first")
-                print(f"   adk cli agent.py")
-            
-        except Exception as e:
-            print(f"❌ Generation failed: {str(e)}")
+        # Usage instructions
+        out.append(f"\n📋 To test this agent:")
+        out.append(f"   cd {agent_dir}")
+        if agent_name == "simple_test_agent":
+            out.append(f"   adk cli agent.py  # No setup required!")
+        elif agent_name == "custom_tool_test_agent":
+            out.append(f"   adk cli agent.py  # Custom tools work out of the box!")
+        else:
+            out.append(f"   # Set up environment variables first")
+            out.append(f"   adk cli agent.py")
+        sys.stdout.write("\n".join(out) + "\n")
     
     print(f"\n🎉 Test agents generated in: {test_dir}")
     print(f"\n💡 Next steps:")
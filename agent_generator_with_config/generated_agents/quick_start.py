@@ -1,22 +1,34 @@
 #!/usr/bin/env python3
 # Quick start script for weather_forecast_agent
 
-from agent import root_agent
+import sys
 
 def main():
-    print("Starting weather_forecast_agent...")
-    print("Main agent: forecaster")
-    print("Available agents: ['location_identifier', 'weather_fetcher', 'weather_agent', 'weather_data_retriever', 'forecaster']")
-    print("Available tools: ['web_search', 'weather_api']")
-    print()
-    print("Generated in current directory for easy testing with ADK Web UI")
-    print()
-    print("To run the agent with ADK CLI:")
-    print("adk cli agent.py")
-    print()
-    print("To use the agent programmatically:")
-    print("response = root_agent.run('Your message here')")
-    print("print(response)")
+    # One write for the whole banner instead of a print call per line
+    sys.stdout.write(
+        "Starting weather_forecast_agent...\n"
+        "Main agent: forecaster\n"
+        "Available agents: ['location_identifier', 'weather_fetcher', 'weather_agent', 'weather_data_retriever', 'forecaster']\n"
+        "Available tools: ['web_search', 'weather_api']\n"
+        "\n"
+        "Generated in current directory for easy testing with ADK Web UI\n"
+        "\n"
+        "To run the agent with ADK CLI:\n"
+        "adk cli agent.py\n"
+        "\n"
+        "To use the agent programmatically:\n"
+        "response = root_agent.run('Your message here')\n"
+        "print(response)\n"
+        "\n"
+        "To load the agent graph from this script:\n"
+        "python quick_start.py --run\n"
+    )
+    
+    # Importing agent builds the whole agent graph, so only do it on request
+    if "--run" in sys.argv[1:]:
+        from agent import root_agent
+        print()
+        print(f"Loaded root agent: {root_agent.name}")
 
 if __name__ == "__main__":
     main()
@@ -12,18 +12,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Prompt Builder Sub-Agent - Creates detailed agent instructions/prompts."""
-
-from google.adk.agents.llm_agent import LlmAgent
-from ..prompts import PROMPT_BUILDER_PROMPT
-
-prompt_builder = LlmAgent(
-    name="prompt_builder",
-    model="gemini-2.0-flash",
-    description="""
-    Prompt Engineering Specialist that creates detailed, effective instructions 
-    for AI agents. Focuses on clear role definition, tool usage, response 
-    guidelines, and error handling.
-    """,
-    instruction=PROMPT_BUILDER_PROMPT
-) 
\ No newline at end of file
+# Generated agent package
@@ -0,0 +1,178 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+data_workflow: Multi-agent workflow for data processing
+Generated by ADK Agent Generator
+"""
+
+from datetime import datetime
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional
+from typing import Optional
+from urllib3.util.retry import Retry
+import json
+import orjson
+import os
+import requests
+
+
+# Tool: Fetch data from API with authentication
+# Pooled connections with retries on transient failures
+_API_SESSION = requests.Session()
+_API_SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+_API_SESSION.mount('http://', HTTPAdapter(max_retries=Retry(total=3, backoff_factor=0.3)))
+
+
+def fetch_api_data(endpoint: str) -> str:
+    """Fetch data from API using environment variables for auth."""
+    try:
+        api_key = os.getenv('API_KEY')
+        base_url = os.getenv('API_BASE_URL', 'https://api.example.com')
+
+        headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+
+        url = f"{base_url}/{endpoint}"
+        
+        response = _API_SESSION.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+        
+        return response.text
+    except Exception as e:
+        return f"Error fetching API data: {str(e)}"
+
+# Tool: Process data with configurable parameters
+def process_data(raw_data: str) -> str:
+    """Process raw data using environment configuration."""
+    try:
+        data = json.loads(raw_data)
+        
+        # Get processing parameters from environment
+        max_records = int(os.getenv('MAX_RECORDS', '1000'))
+        filter_field = os.getenv('FILTER_FIELD', 'status')
+        filter_value = os.getenv('FILTER_VALUE', 'active')
+        
+        # Process data
+        if isinstance(data, list):
+            # Filter while iterating instead of copying a max_records slice first
+            processed = [
+                item for item in islice(data, max_records)
+                if item.get(filter_field) == filter_value
+            ]
+        else:
+            processed = data
+        
+        return json.dumps(processed, indent=2)
+    except Exception as e:
+        return f"Error processing data: {str(e)}"
+
+# Tool: Generate report with environment-based configuration
+def generate_report(processed_data: str) -> str:
+    """Generate report using environment settings."""
+    try:
+        data = orjson.loads(processed_data)
+        
+        # Get report settings from environment
+        report_format = os.getenv('REPORT_FORMAT', 'summary')
+        output_dir = os.getenv('OUTPUT_DIR', './reports')
+        
+        # Generate report
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        if report_format == 'detailed':
+            report = {
+                'timestamp': timestamp,
+                'total_records': len(data) if isinstance(data, list) else 1,
+                'data': data
+            }
+        else:
+            report = {
+                'timestamp': timestamp,
+                'summary': f"Processed {len(data) if isinstance(data, list) else 1} records"
+            }
+        
+        # Save report
+        os.makedirs(output_dir, exist_ok=True)
+        filename = f"report_{timestamp}.json"
+        filepath = os.path.join(output_dir, filename)
+        
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        
+        return f"Report generated: {filepath}"
+    except Exception as e:
+        return f"Error generating report: {str(e)}"
+
+
+# Fetches data from external sources
+fetcher = LlmAgent(
+    name="fetcher",
+    model="gemini-2.0-flash-lite-001",
+    description="""
+    Fetches data from external sources
+    """,
+    instruction="""
+    You fetch data from APIs and databases. Use the fetch_api_data tool.
+    """,
+    tools=[FunctionTool(fetch_api_data)]
+)
+
+# Processes and transforms data
+processor = LlmAgent(
+    name="processor",
+    model="gemini-2.0-flash-lite-001",
+    description="""
+    Processes and transforms data
+    """,
+    instruction="""
+    You process and clean data. Use the process_data tool.
+    """,
+    tools=[FunctionTool(process_data)]
+)
+
+# Generates reports from processed data
+reporter = LlmAgent(
+    name="reporter",
+    model="gemini-2.0-flash-lite-001",
+    description="""
+    Generates reports from processed data
+    """,
+    instruction="""
+    You generate reports and visualizations. Use the generate_report tool.
+    """,
+    tools=[FunctionTool(generate_report)]
+)
+
+# Coordinates the data processing workflow
+coordinator = SequentialAgent(
+    name="coordinator",
+    description="""
+    Coordinates the data processing workflow
+    """,
+    sub_agents=[fetcher, processor, reporter]
+)
+
+
+# Main agent (entry point)
+root_agent = coordinator
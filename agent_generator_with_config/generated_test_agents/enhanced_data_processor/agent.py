@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+enhanced_data_processor: An enhanced agent that processes data with external libraries
+Generated by ADK Agent Generator
+"""
+
+from datetime import datetime
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+from typing import List, Dict, Any, Optional
+from typing import Optional
+import csv
+import orjson
+import pandas as pd
+import requests
+
+
+# Tool: Fetch data from a URL using requests
+# Pooled connections, reused across calls to the same host
+_HTTP_SESSION = requests.Session()
+
+
+def fetch_data(url: str) -> str:
+    """Fetch data from a URL."""
+    try:
+        response = _HTTP_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        
+        # Parse the raw body bytes directly instead of decoding them to text first
+        return orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode()
+    except Exception as e:
+        return f"Error fetching data: {str(e)}"
+
+# Tool: Analyze data using pandas
+def analyze_data(data_json: str) -> str:
+    """Analyze JSON data using pandas."""
+    try:
+        data = orjson.loads(data_json)
+        
+        # Flat records get their shape and columns without pandas
+        if isinstance(data, list) and all(isinstance(row, dict) for row in data):
+            cols = list(dict.fromkeys(key for row in data for key in row))
+            if not cols:
+                return orjson.dumps(
+                    {"shape": (len(data), 0), "columns": [], "dtypes": {}, "summary": "No numeric columns"},
+                    option=orjson.OPT_INDENT_2,
+                ).decode()
+            df = pd.DataFrame.from_records(data, columns=cols)
+        else:
+            df = pd.DataFrame(data)
+        
+        numeric = df.select_dtypes(include='number')
+        analysis = {
+            "shape": df.shape,
+            "columns": list(df.columns),
+            "dtypes": df.dtypes.to_dict(),
+            "summary": numeric.describe().to_dict() if numeric.shape[1] > 0 else "No numeric columns"
+        }
+        
+        return orjson.dumps(
+            analysis,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ).decode()
+    except Exception as e:
+        return f"Error analyzing data: {str(e)}"
+
+# Tool: Export results to CSV using pandas
+def export_results(data_json: str, filename: Optional[str] = None) -> str:
+    """Export data to CSV file."""
+    try:
+        data = orjson.loads(data_json)
+        
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"export_{timestamp}.csv"
+        
+        # Flat records stream straight to CSV without building a DataFrame
+        if isinstance(data, list) and data and all(isinstance(row, dict) for row in data):
+            fieldnames = list(dict.fromkeys(key for row in data for key in row))
+            with open(filename, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(data)
+            shape = (len(data), len(fieldnames))
+        else:
+            import pandas as pd
+            df = pd.DataFrame(data)
+            df.to_csv(filename, index=False)
+            shape = df.shape
+        
+        return f"Data exported to {filename} successfully. Shape: {shape}"
+    except Exception as e:
+        return f"Error exporting data: {str(e)}"
+
+
+# Processes data using pandas and requests
+data_processor = LlmAgent(
+    name="data_processor",
+    model="gemini-2.0-flash-lite-001",
+    description="""
+    Processes data using pandas and requests
+    """,
+    instruction="""
+    You are a data processing assistant. Use the available tools to fetch and analyze data.
+    """,
+    tools=[FunctionTool(fetch_data), FunctionTool(analyze_data), FunctionTool(export_results)]
+)
+
+
+# Main agent (entry point)
+root_agent = data_processor
@@ -0,0 +1,137 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+web_scraper_agent: An agent that scrapes and processes web content
+Generated by ADK Agent Generator
+"""
+
+from bs4 import BeautifulSoup
+from datetime import datetime
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+from typing import List, Dict, Any, Optional
+from typing import Optional
+from urllib.parse import urljoin, urlparse
+import os
+import re
+import requests
+
+
+# Tool: Scrape content from a web page
+# Pooled connections, shared by the scraping tools
+if "_HTTP_SESSION" not in globals():
+    _HTTP_SESSION = requests.Session()
+    _HTTP_SESSION.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+_WS_RE = re.compile(r'\s+')
+
+
+def scrape_page(url: str, selector: Optional[str] = None) -> str:
+    """Scrape content from a web page."""
+    try:
+        response = _HTTP_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.content, 'lxml')
+
+        if selector:
+            elements = soup.select(selector)
+            content = '\n'.join([elem.get_text().strip() for elem in elements])
+        else:
+            content = soup.get_text()
+
+        # Clean up whitespace
+        content = _WS_RE.sub(' ', content).strip()
+
+        return content[:5000]  # Limit to 5000 chars
+    except Exception as e:
+        return f"Error scraping page: {str(e)}"
+
+# Tool: Extract all links from a web page
+# Pooled connections, shared by the scraping tools
+if "_HTTP_SESSION" not in globals():
+    _HTTP_SESSION = requests.Session()
+    _HTTP_SESSION.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+
+
+def extract_links(url: str, internal_only: bool = False) -> str:
+    """Extract all links from a web page."""
+    try:
+        response = _HTTP_SESSION.get(url, timeout=10)
+        response.raise_for_status()
+        
+        soup = BeautifulSoup(response.content, 'lxml')
+        base_domain = urlparse(url).netloc
+
+        links = []
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            full_url = urljoin(url, href)
+
+            if internal_only and urlparse(full_url).netloc != base_domain:
+                continue
+
+            links.append({
+                'text': link.get_text().strip()[:100],
+                'url': full_url
+            })
+
+        return str(links[:50])  # Limit to 50 links
+    except Exception as e:
+        return f"Error extracting links: {str(e)}"
+
+# Tool: Save content to a file
+def save_content(content: str, filename: Optional[str] = None) -> str:
+    """Save content to a file."""
+    try:
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"scraped_content_{timestamp}.txt"
+        
+        # Create directory if it doesn't exist
+        os.makedirs('scraped_data', exist_ok=True)
+        filepath = os.path.join('scraped_data', filename)
+        
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        return f"Content saved to {filepath}. Size: {len(content)} characters"
+    except Exception as e:
+        return f"Error saving content: {str(e)}"
+
+
+# Web scraping and content analysis agent
+scraper = LlmAgent(
+    name="scraper",
+    model="gemini-2.0-flash-lite-001",
+    description="""
+    Web scraping and content analysis agent
+    """,
+    instruction="""
+    You are a web scraping assistant. Use the tools to fetch and analyze web content.
+    """,
+    tools=[FunctionTool(scrape_page), FunctionTool(extract_links), FunctionTool(save_content)]
+)
+
+
+# Main agent (entry point)
+root_agent = scraper
@@ -21,6 +21,8 @@ import os
 import sys
 import tempfile
 import shutil
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 # Add the parent directory to the Python path to enable imports
@@ -46,102 +48,141 @@ except ImportError:
     )
 
 
-def test_config_validation():
-    """Test configuration validation."""
-    print("=== Testing Configuration Validation ===")
-    
-    configs = [
-        ("Simple Research Agent", SIMPLE_RESEARCH_AGENT_CONFIG),
-        ("Customer Service Bot", CUSTOMER_SERVICE_CONFIG),
-        ("Sequential Processing", SEQUENTIAL_PROCESSING_CONFIG),
-        ("Custom Tool Agent", CUSTOM_TOOL_CONFIG),
-    ]
+# Shared by all per-config tests; built once at import
+TEST_CONFIGS = (
+    ("Simple Research Agent", SIMPLE_RESEARCH_AGENT_CONFIG),
+    ("Customer Service Bot", CUSTOMER_SERVICE_CONFIG),
+    ("Sequential Processing", SEQUENTIAL_PROCESSING_CONFIG),
+    ("Custom Tool Agent", CUSTOM_TOOL_CONFIG),
+)
+
+REQUIRED_FILES = ("agent.py", "__init__.py", "requirements.txt", "README.md")
+
+
+@lru_cache(maxsize=64)
+def _compile(source):
+    """Compile generated agent.py source once; identical output reuses the code object."""
+    return compile(source, "agent.py", "exec")
+
+
+def _run_one(name, config_dict, generator):
+    """
+    Validate, generate and syntax-check one test config in a single pass.
     
-    for name, config_dict in configs:
-        print(f"\nTesting {name}...")
+    Args:
+        name: Display name of the test config
+        config_dict: Configuration dictionary
+        generator: Generator shared across configs
         
+    Returns:
+        Dictionary with the outcome of each step, consumed by the test reports
+    """
+    result = {
+        "validation_error": None,
+        "custom_errors": None,
+        "files": None,
+        "generation_error": None,
+        "syntax_error": None,
+    }
+    
+    config = None
+    try:
+        config = AgentProjectConfig(**config_dict)
+        result["custom_errors"] = validate_agent_config(config)
+    except Exception as e:
+        result["validation_error"] = e
+    
+    try:
+        if config is None:
+            files = generate_agent_from_dict(config_dict, generator=generator)
+        else:
+            files = generator.generate_from_config(config)
+        result["files"] = files
+    except Exception as e:
+        result["generation_error"] = e
+        return result
+    
+    if "agent.py" in files:
         try:
-            # Create Pydantic model
-            config = AgentProjectConfig(**config_dict)
-            print(f"  ✅ Pydantic validation passed")
-            
-            # Run custom validation
-            errors = validate_agent_config(config)
-            if errors:
-                print(f"  ❌ Custom validation errors: {errors}")
-            else:
-                print(f"  ✅ Custom validation passed")
-                
-        except Exception as e:
-            print(f"  ❌ Pydantic validation failed: {str(e)}")
+            _compile(files["agent.py"])
+        except SyntaxError as e:
+            result["syntax_error"] = e
+    
+    return result
 
 
-def test_code_generation():
-    """Test code generation functionality."""
-    print("\n=== Testing Code Generation ===")
+def run_config_tests():
+    """Run every test config through validation, generation and syntax checking once."""
+    generator = AgentCodeGenerator()
     
-    configs = [
-        ("Simple Research Agent", SIMPLE_RESEARCH_AGENT_CONFIG),
-        ("Customer Service Bot", CUSTOMER_SERVICE_CONFIG),
-        ("Sequential Processing", SEQUENTIAL_PROCESSING_CONFIG),
-        ("Custom Tool Agent", CUSTOM_TOOL_CONFIG),
-    ]
+    # Validation and generation are CPU-bound, so worker threads would only take turns on the GIL
+    return {name: _run_one(name, config_dict, generator) for name, config_dict in TEST_CONFIGS}
+
+
+def test_config_validation(results):
+    """Test configuration validation."""
+    out = ["=== Testing Configuration Validation ==="]
     
-    for name, config_dict in configs:
-        print(f"\nGenerating code for {name}...")
+    for name, result in results.items():
+        out.append(f"\nTesting {name}...")
         
-        try:
-            # Generate code
-            files = generate_agent_from_dict(config_dict)
-            
-            print(f"  ✅ Generated {len(files)} files:")
-            for filename in files.keys():
-                print(f"    - {filename}")
-                
-            # Check that main files exist
-            required_files = ["agent.py", "__init__.py", "requirements.txt", "README.md"]
-            for required_file in required_files:
-                if required_file in files:
-                    print(f"    ✅ {required_file} generated")
-                else:
-                    print(f"    ❌ {required_file} missing")
-                    
-        except Exception as e:
-            print(f"  ❌ Code generation failed: {str(e)}")
+        if result["validation_error"] is not None:
+            out.append(f"  ❌ Pydantic validation failed: {str(result['validation_error'])}")
+            continue
+        
+        out.append(f"  ✅ Pydantic validation passed")
+        errors = result["custom_errors"]
+        if errors:
+            out.append(f"  ❌ Custom validation errors: {errors}")
+        else:
+            out.append(f"  ✅ Custom validation passed")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def test_generated_agent_syntax():
-    """Test that generated agent code has valid Python syntax."""
-    print("\n=== Testing Generated Code Syntax ===")
-    
-    configs = [
-        ("Simple Research Agent", SIMPLE_RESEARCH_AGENT_CONFIG),
-        ("Customer Service Bot", CUSTOMER_SERVICE_CONFIG),
-        ("Sequential Processing", SEQUENTIAL_PROCESSING_CONFIG),
-        ("Custom Tool Agent", CUSTOM_TOOL_CONFIG),
-    ]
+def test_code_generation(results):
+    """Test code generation functionality."""
+    out = ["\n=== Testing Code Generation ==="]
     
-    for name, config_dict in configs:
-        print(f"\nTesting syntax for {name}...")
+    for name, result in results.items():
+        out.append(f"\nGenerating code for {name}...")
         
-        try:
-            # Generate code
-            files = generate_agent_from_dict(config_dict)
+        if result["generation_error"] is not None:
+            out.append(f"  ❌ Code generation failed: {str(result['generation_error'])}")
+            continue
+        
+        files = result["files"]
+        out.append(f"  ✅ Generated {len(files)} files:")
+        for filename in files.keys():
+            out.append(f"    - {filename}")
             
-            # Check Python syntax for agent.py
-            if "agent.py" in files:
-                agent_code = files["agent.py"]
-                
-                # Try to compile the code to check syntax
-                compile(agent_code, f"{name}_agent.py", "exec")
-                print(f"  ✅ agent.py syntax is valid")
+        # Check that main files exist
+        for required_file in REQUIRED_FILES:
+            if required_file in files:
+                out.append(f"    ✅ {required_file} generated")
             else:
-                print(f"  ❌ agent.py not generated")
-                
-        except SyntaxError as e:
-            print(f"  ❌ Syntax error in agent.py: {str(e)}")
-        except Exception as e:
-            print(f"  ❌ Error: {str(e)}")
+                out.append(f"    ❌ {required_file} missing")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def test_generated_agent_syntax(results):
+    """Test that generated agent code has valid Python syntax."""
+    out = ["\n=== Testing Generated Code Syntax ==="]
+    
+    for name, result in results.items():
+        out.append(f"\nTesting syntax for {name}...")
+        
+        if result["generation_error"] is not None:
+            out.append(f"  ❌ Error: {str(result['generation_error'])}")
+        elif "agent.py" not in result["files"]:
+            out.append(f"  ❌ agent.py not generated")
+        elif result["syntax_error"] is not None:
+            out.append(f"  ❌ Syntax error in agent.py: {str(result['syntax_error'])}")
+        else:
+            out.append(f"  ✅ agent.py syntax is valid")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def test_full_agent_generation():
@@ -163,19 +204,22 @@ def test_full_agent_generation():
             print(f"✅ Generated agent to: {agent_dir}")
             print(f"✅ Files created: {list(files.keys())}")
             
-            # Verify files exist on disk
-            agent_path = Path(agent_dir)
+            # Verify files exist on disk; one stat both checks existence and gives the size
             for filename in files.keys():
-                file_path = agent_path / filename
-                if file_path.exists():
-                    print(f"  ✅ {filename} exists on disk ({file_path.stat().st_size} bytes)")
-                else:
+                try:
+                    size = os.stat(os.path.join(agent_dir, filename)).st_size
+                except FileNotFoundError:
                     print(f"  ❌ {filename} missing from disk")
+                else:
+                    print(f"  ✅ {filename} exists on disk ({size} bytes)")
                     
-            # Try to import the generated agent (syntax check)
-            sys.path.insert(0, agent_dir)
+            # Execute the generated agent from its cached code object (import check)
+            spec = importlib.util.spec_from_file_location(
+                "generated_agent", os.path.join(agent_dir, "agent.py")
+            )
+            agent = importlib.util.module_from_spec(spec)
             try:
-                import agent
+                exec(_compile(files["agent.py"]), agent.__dict__)
                 print(f"  ✅ Agent module imports successfully")
                 if hasattr(agent, 'root_agent'):
                     print(f"  ✅ root_agent is defined")
@@ -183,10 +227,6 @@ def test_full_agent_generation():
                     print(f"  ❌ root_agent not found in module")
             except ImportError as e:
                 print(f"  ❌ Failed to import agent: {str(e)}")
-            finally:
-                # Clean up sys.path
-                if agent_dir in sys.path:
-                    sys.path.remove(agent_dir)
                     
         except Exception as e:
             print(f"❌ Full generation failed: {str(e)}")
@@ -194,34 +234,33 @@ def test_full_agent_generation():
 
 def test_model_from_environment():
     """Test that model configuration uses environment variables correctly."""
-    print("\n=== Testing Model Configuration from Environment ===")
+    out = ["\n=== Testing Model Configuration from Environment ==="]
     
     # Test default model
     default_model = get_default_model()
-    print(f"Default model: {default_model}")
+    out.append(f"Default model: {default_model}")
     
     # Test with environment variable set
     os.environ["DEFAULT_MODEL"] = "test-model-123"
     env_model = get_default_model()
-    print(f"Model from environment: {env_model}")
+    out.append(f"Model from environment: {env_model}")
     
     # Clean up environment
     if "DEFAULT_MODEL" in os.environ:
         del os.environ["DEFAULT_MODEL"]
     
     if env_model == "test-model-123":
-        print("✅ Environment variable model configuration works")
+        out.append("✅ Environment variable model configuration works")
     else:
-        print("❌ Environment variable model configuration failed")
+        out.append("❌ Environment variable model configuration failed")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def print_sample_generated_code():
+def print_sample_generated_code(files):
     """Print sample generated code for review."""
     print("\n=== Sample Generated Code ===")
     
-    # Generate code for simple research agent
-    files = generate_agent_from_dict(SIMPLE_RESEARCH_AGENT_CONFIG)
-    
     print(f"\nGenerated agent.py for Simple Research Agent:")
     print("=" * 60)
     print(files["agent.py"])
@@ -233,15 +272,19 @@ def main():
     print("🚀 ADK Agent Generator with Config - Test Suite")
     print("=" * 60)
     
-    # Run all tests
-    test_config_validation()
-    test_code_generation()
-    test_generated_agent_syntax()
+    # Run all tests; the per-config checks share one pass over the configs
+    results = run_config_tests()
+    test_config_validation(results)
+    test_code_generation(results)
+    test_generated_agent_syntax(results)
     test_full_agent_generation()
     test_model_from_environment()
     
-    # Print sample for manual review
-    print_sample_generated_code()
+    # Print the simple research agent output from the config tests for manual review
+    files = results["Simple Research Agent"]["files"]
+    if files is None:
+        files = generate_agent_from_dict(SIMPLE_RESEARCH_AGENT_CONFIG)
+    print_sample_generated_code(files)
     
     print("\n🎉 All tests completed!")
     print("\nNext steps:")
@@ -14,7 +14,13 @@
 
 """Agent Creator Meta-Agent Package."""
 
-from .agent import root_agent, agent_creator_orchestrator
-
 __version__ = "1.0.0"
-__all__ = ["root_agent", "agent_creator_orchestrator"] 
\ No newline at end of file
+__all__ = ["root_agent", "agent_creator_orchestrator", "app"]
+
+
+def __getattr__(name):
+    # Defer building the agent graph until one of the agents is requested
+    if name in __all__:
+        from . import agent
+        return getattr(agent, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -17,61 +17,111 @@ Agent Creator Meta-Agent - Creates other agents based on user requirements.
 This agent orchestrates the creation of agent configurations and generates code.
 """
 
-from google.adk.agents.llm_agent import LlmAgent
-from google.adk.tools.agent_tool import AgentTool
-from google.adk.tools.function_tool import FunctionTool
+import functools
+from typing import TYPE_CHECKING
 
-from .config import Config
+from .config import get_config
 from .prompts import ORCHESTRATOR_PROMPT
-from .sub_agents.requirements_analyzer import requirements_analyzer
-from .sub_agents.architecture_planner import architecture_planner  
-from .sub_agents.agent_builder import agent_builder
-from .sub_agents.tool_builder import tool_builder
-from .tools.config_merger import (
-    create_project,
-    update_project_metadata,
-    add_agent_to_config,
-    update_agent_in_config,
-    add_tool_to_config,
-    update_tool_in_config,
-    get_full_config,
-    get_config_summary
-)
-from .tools.code_generator import generate_agent_code
 
-configs = Config()
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.apps import App
 
-# Main orchestrator agent
-agent_creator_orchestrator = LlmAgent(
-    name="agent_creator_orchestrator",
-    model=configs.agent_settings.model,
-    description="""
+
+@functools.cache
+def _build_orchestrator() -> "LlmAgent":
+    """Build the orchestrator and its sub-agents on first access."""
+    # ADK itself is only imported once an agent is actually needed
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.tools.agent_tool import AgentTool
+    from google.adk.tools.function_tool import FunctionTool
+    
+    from .sub_agents.analyze_and_plan import analyze_and_plan
+    from .sub_agents.agent_builder import agent_builder
+    from .sub_agents.tool_builder import tool_builder
+    from .sub_agents._shared_client import shared_model
+    from .callbacks import trim_stale_tool_results
+    from .tools.config_merger import (
+        create_project,
+        update_project_metadata,
+        add_agent_to_config,
+        update_agent_in_config,
+        add_tool_to_config,
+        add_cached_tools_to_config,
+        update_tool_in_config,
+        get_full_config,
+        get_config_summary
+    )
+    from .tools.code_generator import generate_agent_code
+    from .tools.examples import get_orchestrator_example
+    from .tools.requirements_heuristic import analyze_requirements_fast
+    
+    # Main orchestrator agent
+    return LlmAgent(
+        name="agent_creator_orchestrator",
+        model=shared_model(get_config().agent_settings.model),
+        description="""
     Main orchestrator for creating agent configurations. Manages the workflow:
-    analyze requirements → plan architecture → build each agent → build tools → generate code.
+    analyze requirements and plan architecture → build each agent → build tools → generate code.
     Passes the evolving config object through the pipeline and manages session state.
     """,
-    instruction=ORCHESTRATOR_PROMPT,
-    tools=[
-        # Sub-agents as tools
-        AgentTool(agent=requirements_analyzer),
-        AgentTool(agent=architecture_planner),
-        AgentTool(agent=agent_builder),
-        AgentTool(agent=tool_builder),
-        
-        # Config management tools
-        FunctionTool(create_project),
-        FunctionTool(update_project_metadata),
-        FunctionTool(add_agent_to_config),
-        FunctionTool(update_agent_in_config),
-        FunctionTool(add_tool_to_config),
-        FunctionTool(update_tool_in_config),
-        FunctionTool(get_full_config),
-        FunctionTool(get_config_summary),
-        
-        # Code generation tool
-        FunctionTool(generate_agent_code)
-    ]
-)
+        instruction=ORCHESTRATOR_PROMPT,
+        # Older builder results are replaced by a stub before each model call,
+        # except under the App, whose context cache needs a stable prefix
+        before_model_callback=trim_stale_tool_results,
+        tools=[
+            # Sub-agents as tools
+            AgentTool(agent=analyze_and_plan),
+            AgentTool(agent=agent_builder),
+            AgentTool(agent=tool_builder),
+            
+            # Deterministic requirements pass for simple requests
+            FunctionTool(analyze_requirements_fast),
+            
+            # Config management tools
+            FunctionTool(create_project),
+            FunctionTool(update_project_metadata),
+            FunctionTool(add_agent_to_config),
+            FunctionTool(update_agent_in_config),
+            FunctionTool(add_tool_to_config),
+            FunctionTool(add_cached_tools_to_config),
+            FunctionTool(update_tool_in_config),
+            FunctionTool(get_full_config),
+            FunctionTool(get_config_summary),
+            
+            # Code generation tool
+            FunctionTool(generate_agent_code),
+            
+            # Full worked examples, fetched only when needed
+            FunctionTool(get_orchestrator_example)
+        ]
+    )
+
+
+@functools.cache
+def _build_app() -> "App":
+    """Wrap the orchestrator in an App that reuses cached context within a session."""
+    from google.adk.agents.context_cache_config import ContextCacheConfig
+    from google.adk.apps import App
+    
+    config = get_config()
+    return App(
+        name=config.app_name,
+        root_agent=_build_orchestrator(),
+        # The instruction and conversation prefix repeat on every orchestrator turn
+        # of a session, so Gemini keeps them cached for the session's lifetime
+        context_cache_config=ContextCacheConfig(
+            min_tokens=config.CONTEXT_CACHE_MIN_TOKENS,
+            ttl_seconds=config.SESSION_TIMEOUT_MINUTES * 60,
+            cache_intervals=config.CONTEXT_CACHE_INTERVALS
+        )
+    )
+
 
-# Main entry point
-root_agent = agent_creator_orchestrator 
\ No newline at end of file
+def __getattr__(name):
+    # Main entry point - root_agent is built when it is first looked up (PEP 562)
+    if name in ("root_agent", "agent_creator_orchestrator"):
+        return _build_orchestrator()
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,95 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Model callbacks for the agent creator orchestrator.
+Keeps the orchestrator's request small by dropping tool results it no longer
+needs; the project configuration itself is always stored server-side.
+"""
+
+import json
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from google.adk.agents.callback_context import CallbackContext
+    from google.adk.models.llm_request import LlmRequest
+    from google.adk.models.llm_response import LlmResponse
+
+# The most recent contents are always sent in full
+KEEP_RECENT_CONTENTS = 4
+
+# Results at most this long (as JSON) cost little and are kept as they are
+MAX_STALE_RESULT_CHARS = 400
+
+# Results the orchestrator relies on for the whole workflow
+_ALWAYS_KEEP = frozenset(("analyze_and_plan", "analyze_requirements_fast", "get_orchestrator_example"))
+
+_TRIMMED_RESULT = {
+    "summarized": True,
+    "note": "Older result trimmed; call get_config_summary(session_id) for the current project state"
+}
+
+
+def trim_stale_tool_results(
+    callback_context: "CallbackContext",
+    llm_request: "LlmRequest"
+) -> Optional["LlmResponse"]:
+    """
+    Replace large, older tool results in the request with a short stub.
+
+    The session history is left untouched; only the contents sent with this
+    model call are rewritten. Requests that go through the App's context cache
+    are sent as they are: a result turns into a stub once it falls out of the
+    last KEEP_RECENT_CONTENTS, which would change the cached prefix on every
+    call and force a new cache each turn.
+
+    Args:
+        callback_context: Context of the current invocation
+        llm_request: Request about to be sent to the model
+
+    Returns:
+        None, so the model is always called
+    """
+    # Set by ADK's context cache processor, which runs before this callback
+    if llm_request.cache_config is not None:
+        return None
+
+    from google.genai import types
+
+    stale = len(llm_request.contents) - KEEP_RECENT_CONTENTS
+    for index in range(max(stale, 0)):
+        content = llm_request.contents[index]
+        if not content.parts or not any(part.function_response for part in content.parts):
+            continue
+
+        parts = []
+        trimmed = False
+        for part in content.parts:
+            response = part.function_response
+            if (
+                response is not None
+                and response.name not in _ALWAYS_KEEP
+                and len(json.dumps(response.response, default=str)) > MAX_STALE_RESULT_CHARS
+            ):
+                part = types.Part(function_response=types.FunctionResponse(
+                    id=response.id, name=response.name, response=_TRIMMED_RESULT
+                ))
+                trimmed = True
+            parts.append(part)
+
+        # Swap in a new Content so the events the request was built from stay intact
+        if trimmed:
+            llm_request.contents[index] = types.Content(role=content.role, parts=parts)
+
+    return None
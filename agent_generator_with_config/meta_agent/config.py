@@ -16,12 +16,23 @@
 
 import os
 import logging
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel, Field
 
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Cheapest sufficient model per sub-agent: the lite model for structured JSON, the
+# full model for writing code and long-form prompts (agent_builder writes instructions)
+MODEL_TIER = {
+    "analyze_and_plan": "gemini-2.0-flash-lite-001",
+    "requirements_analyzer": "gemini-2.0-flash-lite-001",
+    "architecture_planner": "gemini-2.0-flash-lite-001",
+    "agent_builder": "gemini-2.0-flash",
+    "tool_builder": "gemini-2.0-flash",
+}
+
 
 class AgentModel(BaseModel):
     """Agent model settings."""
@@ -39,7 +50,7 @@ class Config(BaseSettings):
         ),
         env_prefix="AGENT_CREATOR_",
         case_sensitive=True,
-        extra="allow"  # Allow extra environment variables
+        extra="ignore"  # Skip unrelated entries in .env
     )
     
     agent_settings: AgentModel = Field(default=AgentModel())
@@ -48,17 +59,17 @@ class Config(BaseSettings):
     # Generation settings
     OUTPUT_BASE_DIR: str = Field(default="./generated_agents")
     SESSION_TIMEOUT_MINUTES: int = Field(default=30)
+    # SQLite file the config merger's sessions are persisted to; empty keeps them in memory only
+    SESSION_DB_PATH: str = Field(default="")
+    
+    # Context caching: smallest prompt worth caching, and invocations before a cache is refreshed
+    CONTEXT_CACHE_MIN_TOKENS: int = Field(default=4096)
+    CONTEXT_CACHE_INTERVALS: int = Field(default=10)
     MAX_AGENTS_PER_PROJECT: int = Field(default=10)
     MAX_TOOLS_PER_PROJECT: int = Field(default=20)
-    
-    # Cloud settings (optional)
-    CLOUD_PROJECT: str = Field(default="")
-    CLOUD_LOCATION: str = Field(default="us-central1")
-    GENAI_USE_VERTEXAI: str = Field(default="0")
-    API_KEY: str | None = Field(default="")
-    
-    # Common Google/ADK environment variables (to avoid validation errors)
-    GOOGLE_API_KEY: str | None = Field(default="")
-    GOOGLE_SEARCH_ENGINE_ID: str | None = Field(default="")
-    GOOGLE_CLOUD_PROJECT: str | None = Field(default="")
-    GOOGLE_GENAI_USE_VERTEXAI: str | None = Field(default="") 
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide settings, reading the environment and .env once."""
+    return Config()
@@ -0,0 +1,55 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Structured output schemas for the planning sub-agents.
+Passed to LlmAgent as output_schema so Gemini decodes straight into JSON of
+this shape instead of following a format described in the prompt.
+"""
+
+from typing import List, Literal
+from pydantic import BaseModel, Field
+
+
+class RequirementsAnalysis(BaseModel):
+    """Structured requirements extracted from a user's request."""
+    
+    purpose: str = Field(..., description="Clear one-sentence description of what the agent does")
+    main_capabilities: List[str] = Field(..., description="Concrete capabilities the agent needs")
+    suggested_tools: List[str] = Field(..., description="Tool names, e.g. web_search, database_query, file_operations")
+    complexity: Literal["simple", "medium", "complex"] = Field(..., description="Overall complexity of the request")
+
+
+class PlannedAgent(BaseModel):
+    """One agent in an architecture plan."""
+    
+    name: str = Field(..., description="Agent name (must be Python identifier)")
+    type: Literal["llm_agent", "sequential_agent", "parallel_agent", "loop_agent"] = Field(..., description="Type of agent")
+    purpose: str = Field(..., description="What this agent does")
+    tools_needed: List[str] = Field(..., description="Names of the tools this agent uses")
+    sub_agents: List[str] = Field(..., description="Names of this agent's sub-agents")
+
+
+class ArchitecturePlan(BaseModel):
+    """Structure of the agent system to build."""
+    
+    main_agent_name: str = Field(..., description="Name of the main/root agent")
+    agents: List[PlannedAgent] = Field(..., description="Every agent in the system, including the main agent")
+
+
+class AnalyzeAndPlanResult(BaseModel):
+    """Requirements analysis and architecture plan returned together."""
+    
+    requirements: RequirementsAnalysis = Field(..., description="Requirements analysis")
+    architecture: ArchitecturePlan = Field(..., description="Architecture plan based on the requirements")
@@ -14,16 +14,28 @@
 
 """Sub-agents for the Agent Creator Meta-Agent."""
 
-from .requirements_analyzer import requirements_analyzer
-from .architecture_planner import architecture_planner
-from .agent_builder import agent_builder
-from .prompt_builder import prompt_builder
-from .tool_builder import tool_builder
+# Importing the modules is cheap; each agent is only built on first access
+from . import (
+    analyze_and_plan,
+    requirements_analyzer,
+    architecture_planner,
+    agent_builder,
+    tool_builder,
+)
 
 __all__ = [
+    "analyze_and_plan",
     "requirements_analyzer",
     "architecture_planner", 
     "agent_builder",
-    "prompt_builder",
     "tool_builder"
-] 
\ No newline at end of file
+]
+
+# The submodules share their agents' names; unbind them so lookups reach __getattr__
+_MODULES = {name: globals().pop(name) for name in __all__}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(_MODULES[name], name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,24 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sub-agent descriptions, shown to the orchestrator in its tool list on every turn."""
+
+# Kept to one short line each: every word here is sent with each orchestrator call
+DESCRIPTIONS = {
+    "analyze_and_plan": "Extracts requirements from a request and returns them with an architecture plan.",
+    "requirements_analyzer": "Extracts purpose, capabilities, tools and complexity from a request.",
+    "architecture_planner": "Plans the agents, their types, tools and sub-agents for a set of requirements.",
+    "agent_builder": "Builds one agent's config and instruction and adds it to the project.",
+    "tool_builder": "Writes custom tool functions and adds them to the project.",
+}
@@ -0,0 +1,42 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared model backends for the meta-agent and its sub-agents."""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.adk.models import Gemini
+
+
+@functools.cache
+def shared_model(model_name: str) -> "Gemini":
+    """
+    Return the single Gemini backend for a model name.
+    
+    A model given as a string makes every LlmAgent resolve its own Gemini
+    instance, each with its own API client and connection pool. Passing this
+    shared instance instead lets all agents on the same model reuse one client
+    and its open connections.
+    
+    Args:
+        model_name: Gemini model name, e.g. "gemini-2.0-flash"
+        
+    Returns:
+        Gemini model object shared by every caller with the same name
+    """
+    from google.adk.models import Gemini
+    
+    return Gemini(model=model_name)
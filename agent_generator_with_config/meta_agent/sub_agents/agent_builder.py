@@ -14,26 +14,39 @@
 
 """Agent Builder Sub-Agent - Builds individual agent configurations."""
 
-from google.adk.agents.llm_agent import LlmAgent
-from google.adk.tools.agent_tool import AgentTool
-from google.adk.tools.function_tool import FunctionTool
+import functools
+from typing import TYPE_CHECKING
 
+from ..config import MODEL_TIER
+from ._descriptions import DESCRIPTIONS
+from ._shared_client import shared_model
 from ..prompts import AGENT_BUILDER_PROMPT
-from .prompt_builder import prompt_builder
 from ..tools.config_merger import add_agent_to_config, update_agent_in_config
 
-agent_builder = LlmAgent(
-    name="agent_builder",
-    model="gemini-2.0-flash",
-    description="""
-    Agent Configuration Specialist that builds detailed configurations for 
-    individual agents. Creates basic agent config, calls prompt builder for 
-    instructions, then merges everything using config_merger tools.
-    """,
-    instruction=AGENT_BUILDER_PROMPT,
-    tools=[
-        AgentTool(agent=prompt_builder),
-        FunctionTool(add_agent_to_config),
-        FunctionTool(update_agent_in_config)
-    ]
-) 
\ No newline at end of file
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+
+
+@functools.cache
+def get_agent() -> "LlmAgent":
+    """Build the agent builder sub-agent on first use."""
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.tools.function_tool import FunctionTool
+    
+    return LlmAgent(
+        name="agent_builder",
+        model=shared_model(MODEL_TIER["agent_builder"]),
+        description=DESCRIPTIONS["agent_builder"],
+        instruction=AGENT_BUILDER_PROMPT,
+        tools=[
+            FunctionTool(add_agent_to_config),
+            FunctionTool(update_agent_in_config)
+        ]
+    )
+
+
+def __getattr__(name):
+    # agent_builder is built when it is first looked up (PEP 562)
+    if name == "agent_builder":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,48 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Analyze and Plan Sub-Agent - Extracts requirements and designs the agent system in one call."""
+
+import functools
+from typing import TYPE_CHECKING
+
+from ..config import MODEL_TIER
+from ._descriptions import DESCRIPTIONS
+from ._shared_client import shared_model
+from ..prompts import ANALYZE_AND_PLAN_PROMPT
+from ..schemas import AnalyzeAndPlanResult
+
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+
+
+@functools.cache
+def get_agent() -> "LlmAgent":
+    """Build the analyze-and-plan sub-agent on first use."""
+    from google.adk.agents.llm_agent import LlmAgent
+    
+    return LlmAgent(
+        name="analyze_and_plan",
+        model=shared_model(MODEL_TIER["analyze_and_plan"]),
+        description=DESCRIPTIONS["analyze_and_plan"],
+        instruction=ANALYZE_AND_PLAN_PROMPT,
+        output_schema=AnalyzeAndPlanResult
+    )
+
+
+def __getattr__(name):
+    # analyze_and_plan is built when it is first looked up (PEP 562)
+    if name == "analyze_and_plan":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,16 +14,35 @@
 
 """Architecture Planner Sub-Agent - Designs agent system structure."""
 
-from google.adk.agents.llm_agent import LlmAgent
+import functools
+from typing import TYPE_CHECKING
+
+from ..config import MODEL_TIER
+from ._descriptions import DESCRIPTIONS
+from ._shared_client import shared_model
 from ..prompts import ARCHITECTURE_PLANNER_PROMPT
+from ..schemas import ArchitecturePlan
+
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+
+
+@functools.cache
+def get_agent() -> "LlmAgent":
+    """Build the architecture planner sub-agent on first use."""
+    from google.adk.agents.llm_agent import LlmAgent
+    
+    return LlmAgent(
+        name="architecture_planner",
+        model=shared_model(MODEL_TIER["architecture_planner"]),
+        description=DESCRIPTIONS["architecture_planner"],
+        instruction=ARCHITECTURE_PLANNER_PROMPT,
+        output_schema=ArchitecturePlan
+    )
+
 
-architecture_planner = LlmAgent(
-    name="architecture_planner",
-    model="gemini-2.0-flash-lite-001",
-    description="""
-    Agent Architecture Specialist that designs the structure of agent systems.
-    Creates simple, clear architecture plans defining agents, their roles, 
-    and relationships without complex data flow design.
-    """,
-    instruction=ARCHITECTURE_PLANNER_PROMPT
-) 
\ No newline at end of file
+def __getattr__(name):
+    # architecture_planner is built when it is first looked up (PEP 562)
+    if name == "architecture_planner":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
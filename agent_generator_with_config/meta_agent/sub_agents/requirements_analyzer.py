@@ -14,16 +14,35 @@
 
 """Requirements Analyzer Sub-Agent - Analyzes user requirements for agent creation."""
 
-from google.adk.agents.llm_agent import LlmAgent
+import functools
+from typing import TYPE_CHECKING
+
+from ..config import MODEL_TIER
+from ._descriptions import DESCRIPTIONS
+from ._shared_client import shared_model
 from ..prompts import REQUIREMENTS_ANALYZER_PROMPT
+from ..schemas import RequirementsAnalysis
+
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+
+
+@functools.cache
+def get_agent() -> "LlmAgent":
+    """Build the requirements analyzer sub-agent on first use."""
+    from google.adk.agents.llm_agent import LlmAgent
+    
+    return LlmAgent(
+        name="requirements_analyzer",
+        model=shared_model(MODEL_TIER["requirements_analyzer"]),
+        description=DESCRIPTIONS["requirements_analyzer"],
+        instruction=REQUIREMENTS_ANALYZER_PROMPT,
+        output_schema=RequirementsAnalysis
+    )
+
 
-requirements_analyzer = LlmAgent(
-    name="requirements_analyzer",
-    model="gemini-2.0-flash",
-    description="""
-    Requirements Analysis Specialist that extracts and structures user requirements 
-    for agent creation. Analyzes user input to understand purpose, capabilities, 
-    tools needed, and complexity level.
-    """,
-    instruction=REQUIREMENTS_ANALYZER_PROMPT
-)
\ No newline at end of file
+def __getattr__(name):
+    # requirements_analyzer is built when it is first looked up (PEP 562)
+    if name == "requirements_analyzer":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,23 +14,40 @@
 
 """Tool Builder Sub-Agent - Creates custom tools with Python code."""
 
-from google.adk.agents.llm_agent import LlmAgent
-from google.adk.tools.function_tool import FunctionTool
+import functools
+from typing import TYPE_CHECKING
 
+from ..config import MODEL_TIER
+from ._descriptions import DESCRIPTIONS
+from ._shared_client import shared_model
 from ..prompts import TOOL_BUILDER_PROMPT
-from ..tools.config_merger import add_tool_to_config, update_tool_in_config
-
-tool_builder = LlmAgent(
-    name="tool_builder",
-    model="gemini-2.0-flash",
-    description="""
-    Tool Creation Specialist that creates custom tools with Python function code.
-    Writes clean, functional Python code with proper error handling and adds 
-    tools to the project configuration.
-    """,
-    instruction=TOOL_BUILDER_PROMPT,
-    tools=[
-        FunctionTool(add_tool_to_config),
-        FunctionTool(update_tool_in_config)
-    ]
-) 
\ No newline at end of file
+from ..tools.config_merger import add_tool_to_config, add_tools_to_config_bulk, update_tool_in_config
+
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+
+
+@functools.cache
+def get_agent() -> "LlmAgent":
+    """Build the tool builder sub-agent on first use."""
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.tools.function_tool import FunctionTool
+    
+    return LlmAgent(
+        name="tool_builder",
+        model=shared_model(MODEL_TIER["tool_builder"]),
+        description=DESCRIPTIONS["tool_builder"],
+        instruction=TOOL_BUILDER_PROMPT,
+        tools=[
+            FunctionTool(add_tools_to_config_bulk),
+            FunctionTool(add_tool_to_config),
+            FunctionTool(update_tool_in_config)
+        ]
+    )
+
+
+def __getattr__(name):
+    # tool_builder is built when it is first looked up (PEP 562)
+    if name == "tool_builder":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,79 +1,94 @@
 #!/usr/bin/env python3
 """
 Test script to verify all imports work correctly for the meta-agent.
-Run this before testing the full system.
+Run this before testing the full system, either directly or with
+pytest (test failures raise instead of returning a status).
 """
 
 import sys
 import os
+import json
+import traceback
+import importlib
+import importlib.util
 from pathlib import Path
 
+# Import the modules as the meta_agent package so their relative imports resolve
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# (label, module, names that must resolve, success message), reported in this order
+IMPORT_CHECKS = (
+    ("config", "meta_agent.config", ("Config",),
+     lambda names: f"Config loaded - Model: {names['Config']().agent_settings.model}"),
+    ("prompts", "meta_agent.prompts", ("ORCHESTRATOR_PROMPT",),
+     lambda names: f"Prompts loaded - Orchestrator prompt length: {len(names['ORCHESTRATOR_PROMPT'])}"),
+    ("config merger tools", "meta_agent.tools.config_merger", ("create_project", "add_agent_to_config"),
+     lambda names: "Config merger tools loaded"),
+    ("code generator tools", "meta_agent.tools.code_generator", ("generate_agent_code",),
+     lambda names: "Code generator tools loaded"),
+    ("sub-agents", "meta_agent.sub_agents", (
+        "requirements_analyzer",
+        "architecture_planner",
+        "agent_builder",
+        "tool_builder",
+    ), lambda names: "All sub-agents loaded"),
+    ("main agent", "meta_agent.agent", ("root_agent", "agent_creator_orchestrator"),
+     lambda names: f"Main agent loaded - Name: {names['root_agent'].name}"),
+)
+
+
+def _check_import(check):
+    """Import one module and resolve the names it must provide."""
+    _, module_name, names, _ = check
+    # A missing module is reported by its own name, not by whatever it imports first
+    if importlib.util.find_spec(module_name) is None:
+        raise ImportError(f"No module named '{module_name}'")
+    module = importlib.import_module(module_name)
+    return {name: getattr(module, name) for name in names}
+
+
 def test_imports():
     """Test all the import statements."""
     
-    print("Testing meta-agent imports...")
+    out = ["Testing meta-agent imports..."]
     
-    try:
-        print("1. Testing config...")
-        from config import Config
-        config = Config()
-        print(f"   ✅ Config loaded - Model: {config.agent_settings.model}")
-        
-        print("2. Testing prompts...")
-        from prompts import ORCHESTRATOR_PROMPT
-        print(f"   ✅ Prompts loaded - Orchestrator prompt length: {len(ORCHESTRATOR_PROMPT)}")
-        
-        print("3. Testing config merger tools...")
-        from tools.config_merger import create_project, add_agent_to_config
-        print("   ✅ Config merger tools loaded")
-        
-        print("4. Testing code generator tools...")
-        from tools.code_generator import generate_agent_code
-        print("   ✅ Code generator tools loaded")
-        
-        print("5. Testing sub-agents...")
-        from sub_agents.requirements_analyzer import requirements_analyzer
-        from sub_agents.architecture_planner import architecture_planner
-        from sub_agents.agent_builder import agent_builder
-        from sub_agents.prompt_builder import prompt_builder
-        from sub_agents.tool_builder import tool_builder
-        print("   ✅ All sub-agents loaded")
-        
-        print("6. Testing main agent...")
-        from agent import root_agent, agent_creator_orchestrator
-        print(f"   ✅ Main agent loaded - Name: {root_agent.name}")
-        
-        print("\n🎉 ALL IMPORTS SUCCESSFUL!")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Import failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    # One at a time: the modules import each other, and importing a package from several
+    # threads can hand a thread a partially initialised module or deadlock on import locks
+    loaded = [_check_import(check) for check in IMPORT_CHECKS]
+    
+    # One buffered report instead of a print per step
+    for number, ((label, _, _, message), names) in enumerate(zip(IMPORT_CHECKS, loaded), start=1):
+        out.append(f"{number}. Testing {label}...")
+        out.append(f"   ✅ {message(names)}")
+    
+    out.append("\n🎉 ALL IMPORTS SUCCESSFUL!")
+    sys.stdout.write("\n".join(out) + "\n")
 
 def test_config_creation():
     """Test creating a simple config."""
     
+    from meta_agent.tools.config_merger import create_project, get_config_summary
+    
     print("\nTesting config operations...")
     
+    # Test creating a project
+    session_id = "test-session-123"
+    result = create_project(session_id, "test_project", "A test project")
+    assert json.loads(result)["result"]["success"], result
+    print(f"   ✅ Project creation: {result}")
+    
+    # Test getting summary
+    summary = get_config_summary(session_id)
+    assert json.loads(summary)["success"], summary
+    print(f"   ✅ Config summary: {summary}")
+
+def _passed(test, failure_message):
+    """Run one test for the script entry point, reporting instead of raising."""
     try:
-        from tools.config_merger import create_project, get_config_summary
-        
-        # Test creating a project
-        session_id = "test-session-123"
-        result = create_project(session_id, "test_project", "A test project")
-        print(f"   ✅ Project creation: {result}")
-        
-        # Test getting summary
-        summary = get_config_summary(session_id)
-        print(f"   ✅ Config summary: {summary}")
-        
+        test()
         return True
-        
     except Exception as e:
-        print(f"   ❌ Config operation failed: {str(e)}")
-        import traceback
+        print(f"\n❌ {failure_message}: {str(e)}")
         traceback.print_exc()
         return False
 
@@ -85,11 +100,11 @@ def main():
     print("=" * 60)
     
     # Test imports
-    imports_ok = test_imports()
+    imports_ok = _passed(test_imports, "Import failed")
     
     if imports_ok:
         # Test basic operations
-        config_ok = test_config_creation()
+        config_ok = _passed(test_config_creation, "Config operation failed")
         
         if config_ok:
             print("\n🎉 ALL TESTS PASSED! Meta-agent is ready to use.")
@@ -102,4 +117,4 @@ def main():
         print("\n❌ Import tests failed. Please fix the issues above.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -20,8 +20,13 @@ from .config_merger import (
     add_agent_to_config,
     update_agent_in_config,
     add_tool_to_config,
+    add_tools_to_config_bulk,
+    add_cached_tools_to_config,
     update_tool_in_config,
     get_full_config,
+    get_full_config_obj,
+    get_config_revision,
+    add_session_delete_listener,
     get_config_summary,
     update_build_context,
     delete_session,
@@ -32,6 +37,8 @@ from .code_generator import (
     preview_generated_code,
     validate_configuration
 )
+from .examples import get_orchestrator_example
+from .requirements_heuristic import analyze_requirements_fast
 
 __all__ = [
     # Config merger functions
@@ -40,8 +47,13 @@ __all__ = [
     "add_agent_to_config",
     "update_agent_in_config",
     "add_tool_to_config",
+    "add_tools_to_config_bulk",
+    "add_cached_tools_to_config",
     "update_tool_in_config",
     "get_full_config",
+    "get_full_config_obj",
+    "get_config_revision",
+    "add_session_delete_listener",
     "get_config_summary",
     "update_build_context",
     "delete_session",
@@ -49,5 +61,9 @@ __all__ = [
     # Code generator functions
     "generate_agent_code",
     "preview_generated_code",
-    "validate_configuration"
+    "validate_configuration",
+    # Orchestrator examples
+    "get_orchestrator_example",
+    # Requirements heuristic
+    "analyze_requirements_fast"
 ] 
\ No newline at end of file
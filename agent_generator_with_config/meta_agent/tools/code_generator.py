@@ -17,11 +17,12 @@ Code Generator Tool - Converts final agent configuration to Python code files.
 Uses the same AgentCodeGenerator class as the main code generator for consistency.
 """
 
+import hashlib
 import json
-import os
+import string
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 # Import the AgentCodeGenerator class and related schemas
 try:
@@ -46,7 +47,167 @@ except ImportError:
         print("Make sure you're running from the correct directory")
         raise
 
-from .config_merger import get_full_config
+from .config_merger import add_session_delete_listener, get_config_revision, get_full_config_obj
+
+# orjson is optional; it encodes the large project_config payloads several times faster
+try:
+    import orjson
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    def _dumps(obj: Any) -> str:
+        return _dumps_bytes(obj).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return _dumps(obj).encode('utf-8')
+
+# Parsed config per session: (config_merger revision, project_config, AgentProjectConfig)
+_parsed_configs: Dict[str, Tuple[int, Dict[str, Any], AgentProjectConfig]] = {}
+
+
+# Generated files per session, valid while the session's cached AgentProjectConfig is unchanged
+_generated_files: Dict[str, Tuple[AgentProjectConfig, Dict[str, str]]] = {}
+
+# Validation errors per session, keyed the same way as _generated_files
+_validation_errors: Dict[str, Tuple[AgentProjectConfig, List[str]]] = {}
+
+
+def _forget_session(session_id: str) -> None:
+    """Drop everything cached for a deleted session."""
+    _parsed_configs.pop(session_id, None)
+    _generated_files.pop(session_id, None)
+    _validation_errors.pop(session_id, None)
+
+
+add_session_delete_listener(_forget_session)
+
+# Quick start script written next to each generated agent; built once at import
+_QUICK_START_TEMPLATE = string.Template("""#!/usr/bin/env python3
+# Quick start script for $project_name
+
+import sys
+
+def main():
+    # One write for the whole banner instead of a print call per line
+    sys.stdout.write(
+        "Starting $project_name...\\n"
+        "Main agent: $main_agent\\n"
+        "Available agents: $agents\\n"
+        "Available tools: $tools\\n"
+        "\\n"
+        "Generated in current directory for easy testing with ADK Web UI\\n"
+        "\\n"
+        "To run the agent with ADK CLI:\\n"
+        "adk cli agent.py\\n"
+        "\\n"
+        "To use the agent programmatically:\\n"
+        "response = root_agent.run('Your message here')\\n"
+        "print(response)\\n"
+        "\\n"
+        "To load the agent graph from this script:\\n"
+        "python quick_start.py --run\\n"
+    )
+    
+    # Importing agent builds the whole agent graph, so only do it on request
+    if "--run" in sys.argv[1:]:
+        from agent import root_agent
+        print()
+        print(f"Loaded root agent: {root_agent.name}")
+
+if __name__ == "__main__":
+    main()
+""")
+
+
+class _ConfigFetchError(Exception):
+    """Raised when a session's config is unavailable."""
+
+
+def _load_config(session_id: str) -> Tuple[Dict[str, Any], AgentProjectConfig]:
+    """
+    Fetch a session's project config and build its AgentProjectConfig.
+    
+    The config is read in-process rather than through the get_full_config JSON
+    string, and both are reused until the stored config changes, so repeated
+    preview, validate and generate calls skip the model construction.
+    
+    Args:
+        session_id: Session identifier containing the configuration
+        
+    Returns:
+        Tuple of the project_config dictionary and the AgentProjectConfig built from it
+        
+    Raises:
+        _ConfigFetchError: If the configuration could not be fetched
+        Exception: Whatever AgentProjectConfig raises for an invalid config
+    """
+    # Every config_merger update bumps the revision, even within one clock tick;
+    # it is read first so a concurrent update can only make the entry look stale
+    version = get_config_revision(session_id)
+    config_data = get_full_config_obj(session_id)
+    if not config_data.get("success"):
+        raise _ConfigFetchError(config_data.get('error', 'Unknown error'))
+    
+    cached = _parsed_configs.get(session_id)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+    
+    project_config = config_data["config"]["project_config"]
+    config_obj = AgentProjectConfig.model_validate(project_config)
+    
+    # A changed config replaces the session's previous entry
+    _parsed_configs[session_id] = (version, project_config, config_obj)
+    return project_config, config_obj
+
+
+def _generate_files(session_id: str, config_obj: AgentProjectConfig) -> Dict[str, str]:
+    """
+    Generate the code files for a session, reusing them while its config is unchanged.
+    
+    _load_config hands out the same AgentProjectConfig until the config
+    changes, so the object identity tells whether earlier output still applies.
+    Callers must treat the returned dictionary as read-only.
+    
+    Args:
+        session_id: Session identifier containing the configuration
+        config_obj: Configuration returned by _load_config for the session
+        
+    Returns:
+        Dictionary mapping filename to file content
+    """
+    cached = _generated_files.get(session_id)
+    if cached is not None and cached[0] is config_obj:
+        return cached[1]
+    
+    generated_files = AgentCodeGenerator().generate_from_config(config_obj, output_dir=None)
+    _generated_files[session_id] = (config_obj, generated_files)
+    return generated_files
+
+
+def _validate_config(session_id: str, config_obj: AgentProjectConfig) -> List[str]:
+    """
+    Validate a session's config, reusing the result while its config is unchanged.
+    
+    Callers must treat the returned list as read-only.
+    
+    Args:
+        session_id: Session identifier containing the configuration
+        config_obj: Configuration returned by _load_config for the session
+        
+    Returns:
+        List of validation errors, empty if the config is valid
+    """
+    cached = _validation_errors.get(session_id)
+    if cached is not None and cached[0] is config_obj:
+        return cached[1]
+    
+    validation_errors = validate_agent_config(config_obj)
+    _validation_errors[session_id] = (config_obj, validation_errors)
+    return validation_errors
 
 
 def generate_agent_code(
@@ -73,44 +234,35 @@ def generate_agent_code(
     }
     
     try:
-        # Get the full configuration
-        config_response = get_full_config(session_id)
-        config_data = json.loads(config_response)
-        
-        if not config_data.get("success"):
-            return json.dumps({
-                "success": False,
-                "error": f"Failed to get configuration: {config_data.get('error', 'Unknown error')}"
-            }, indent=2)
-        
-        # Extract the project configuration
-        full_config = config_data["config"]
-        project_config = full_config["project_config"]
-        
-        # Create AgentProjectConfig object
+        # Get the full configuration and its AgentProjectConfig object
         try:
-            config_obj = AgentProjectConfig(**project_config)
+            project_config, config_obj = _load_config(session_id)
+        except _ConfigFetchError as fetch_error:
+            return _dumps({
+                "success": False,
+                "error": f"Failed to get configuration: {str(fetch_error)}"
+            })
         except Exception as config_error:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Configuration parsing error: {str(config_error)}"
-            }, indent=2)
+            })
         
         # Validate the configuration if requested
         if validate_config:
             try:
-                validation_errors = validate_agent_config(config_obj)
+                validation_errors = _validate_config(session_id, config_obj)
                 if validation_errors:
-                    return json.dumps({
+                    return _dumps({
                         "success": False,
                         "error": "Configuration validation failed",
                         "validation_errors": validation_errors
-                    }, indent=2)
+                    })
             except Exception as validation_error:
-                return json.dumps({
+                return _dumps({
                     "success": False,
                     "error": f"Configuration validation error: {str(validation_error)}"
-                }, indent=2)
+                })
         
         # Create output directory - generate directly in the current folder for easy testing
         project_name = project_config["project_name"]
@@ -119,65 +271,53 @@ def generate_agent_code(
         # Ensure the directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Generate the code using the same AgentCodeGenerator class
-        generator = AgentCodeGenerator()
-        generated_files = generator.generate_from_config(config_obj, str(output_dir))
+        # Generate the code using the same AgentCodeGenerator class, reusing a
+        # preview of the same config
+        generated_files = _generate_files(session_id, config_obj)
+        
+        # Names and counts shared by the summary and the quick start script
+        agents = project_config["agents"]
+        tools = project_config["tools"]
+        main_agent = project_config["main_agent"]
+        agent_names = list(agents)
+        tool_names = list(tools)
+        
+        # One timestamp for the summary and the response
+        generated_at = datetime.now().isoformat()
         
         # Create a summary file
         summary = {
             "session_id": session_id,
             "project_name": project_name,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": generated_at,
             "output_directory": str(output_dir),
             "generated_files": list(generated_files.keys()),
-            "agent_count": len(project_config["agents"]),
-            "tool_count": len(project_config["tools"]),
-            "main_agent": project_config["main_agent"],
-            "agents": list(project_config["agents"].keys()),
-            "tools": list(project_config["tools"].keys())
+            "agent_count": len(agents),
+            "tool_count": len(tools),
+            "main_agent": main_agent,
+            "agents": agent_names,
+            "tools": tool_names
         }
         
-        # Write summary file
-        summary_path = output_dir / "generation_summary.json"
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
-        
-        # Save the project configuration for reference and regeneration
-        config_path = output_dir / "project_config.json"
-        with open(config_path, 'w') as f:
-            json.dump(project_config, f, indent=2)
-        
         # Create a quick start script
-        quick_start_content = f"""#!/usr/bin/env python3
-# Quick start script for {project_name}
-
-from agent import root_agent
-
-def main():
-    print("Starting {project_name}...")
-    print("Main agent: {project_config['main_agent']}")
-    print("Available agents: {list(project_config['agents'].keys())}")
-    print("Available tools: {list(project_config['tools'].keys())}")
-    print()
-    print("Generated in current directory for easy testing with ADK Web UI")
-    print()
-    print("To run the agent with ADK CLI:")
-    print("adk cli agent.py")
-    print()
-    print("To use the agent programmatically:")
-    print("response = root_agent.run('Your message here')")
-    print("print(response)")
-
-if __name__ == "__main__":
-    main()
-"""
-        
-        quick_start_path = output_dir / "quick_start.py"
-        with open(quick_start_path, 'w') as f:
-            f.write(quick_start_content)
-        
-        # Make quick start script executable
-        os.chmod(quick_start_path, 0o755)
+        quick_start_content = _QUICK_START_TEMPLATE.substitute(
+            project_name=project_name,
+            main_agent=main_agent,
+            agents=agent_names,
+            tools=tool_names
+        )
+        
+        # Write the generated code, the summary, the project configuration (kept
+        # for reference and regeneration) and the quick start script in one pass
+        project_config_bytes = _dumps_bytes(project_config)
+        written = AgentCodeGenerator().write_to_disk({
+            **generated_files,
+            "generation_summary.json": _dumps_bytes(summary),
+            "project_config.json": project_config_bytes,
+            "quick_start.py": quick_start_content
+        }, str(output_dir), executable=frozenset(("quick_start.py",)))
+        for file_path in written:
+            print(f"Generated: {file_path}")
         
         result = {
             "success": True,
@@ -185,15 +325,17 @@ if __name__ == "__main__":
             "output_directory": str(output_dir),
             "generated_files": list(generated_files.keys()) + ["generation_summary.json", "project_config.json", "quick_start.py"],
             "summary": summary,
-            "project_config": project_config
+            # The config was just written to disk; point at it rather than encoding it again
+            "project_config_path": str(output_dir / "project_config.json"),
+            "project_config_hash": hashlib.blake2b(project_config_bytes, digest_size=16).hexdigest()
         }
         
-        return json.dumps({
+        return _dumps({
             "tool": "generate_agent_code",
             "input": input_params,
             "result": result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+            "timestamp": generated_at
+        })
         
     except Exception as e:
         error_result = {
@@ -201,12 +343,12 @@ if __name__ == "__main__":
             "error": f"Failed to generate agent code: {str(e)}"
         }
         
-        return json.dumps({
+        return _dumps({
             "tool": "generate_agent_code",
             "input": input_params,
             "result": error_result,
             "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        })
 
 
 def preview_generated_code(
@@ -225,53 +367,43 @@ def preview_generated_code(
         JSON string with the file content
     """
     try:
-        # Get the full configuration
-        config_response = get_full_config(session_id)
-        config_data = json.loads(config_response)
-        
-        if not config_data.get("success"):
-            return json.dumps({
-                "success": False,
-                "error": f"Failed to get configuration: {config_data.get('error', 'Unknown error')}"
-            }, indent=2)
-        
-        # Extract the project configuration
-        full_config = config_data["config"]
-        project_config = full_config["project_config"]
-        
-        # Create AgentProjectConfig object
+        # Get the full configuration and its AgentProjectConfig object
         try:
-            config_obj = AgentProjectConfig(**project_config)
+            project_config, config_obj = _load_config(session_id)
+        except _ConfigFetchError as fetch_error:
+            return _dumps({
+                "success": False,
+                "error": f"Failed to get configuration: {str(fetch_error)}"
+            })
         except Exception as config_error:
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"Configuration parsing error: {str(config_error)}"
-            }, indent=2)
+            })
         
         # Generate the code using the same AgentCodeGenerator class (without writing to disk)
-        generator = AgentCodeGenerator()
-        generated_files = generator.generate_from_config(config_obj, output_dir=None)
+        generated_files = _generate_files(session_id, config_obj)
         
         if file_name not in generated_files:
             available_files = list(generated_files.keys())
-            return json.dumps({
+            return _dumps({
                 "success": False,
                 "error": f"File '{file_name}' not found in generated files",
                 "available_files": available_files
-            }, indent=2)
+            })
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "file_name": file_name,
             "content": generated_files[file_name],
             "available_files": list(generated_files.keys())
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to preview code: {str(e)}"
-        }, indent=2)
+        })
 
 
 def validate_configuration(session_id: str) -> str:
@@ -289,30 +421,21 @@ def validate_configuration(session_id: str) -> str:
     }
     
     try:
-        # Get the full configuration
-        config_response = get_full_config(session_id)
-        config_data = json.loads(config_response)
-        
-        if not config_data.get("success"):
+        # Get the full configuration and validate it
+        try:
+            project_config, config_obj = _load_config(session_id)
+            validation_errors = _validate_config(session_id, config_obj)
+        except _ConfigFetchError as fetch_error:
             error_result = {
                 "success": False,
-                "error": f"Failed to get configuration: {config_data.get('error', 'Unknown error')}"
+                "error": f"Failed to get configuration: {str(fetch_error)}"
             }
-            return json.dumps({
+            return _dumps({
                 "tool": "validate_configuration",
                 "input": input_params,
                 "result": error_result,
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
-        
-        # Extract the project configuration
-        full_config = config_data["config"]
-        project_config = full_config["project_config"]
-        
-        # Validate the configuration  
-        try:
-            config_obj = AgentProjectConfig(**project_config)
-            validation_errors = validate_agent_config(config_obj)
+            })
         except Exception as validation_error:
             error_result = {
                 "success": False,
@@ -320,12 +443,12 @@ def validate_configuration(session_id: str) -> str:
                 "error": f"Configuration validation error: {str(validation_error)}",
                 "message": "Failed to validate configuration due to schema error"
             }
-            return json.dumps({
+            return _dumps({
                 "tool": "validate_configuration",
                 "input": input_params,
                 "result": error_result,
                 "timestamp": datetime.now().isoformat()
-            }, indent=2)
+            })
         
         if validation_errors:
             error_result = {
@@ -349,12 +472,12 @@ def validate_configuration(session_id: str) -> str:
                 }
             }
         
-        return json.dumps({
+        return _dumps({
             "tool": "validate_configuration",
             "input": input_params,
             "result": result,
             "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        })
         
     except Exception as e:
         error_result = {
@@ -362,9 +485,9 @@ def validate_configuration(session_id: str) -> str:
             "error": f"Failed to validate configuration: {str(e)}"
         }
         
-        return json.dumps({
+        return _dumps({
             "tool": "validate_configuration",
             "input": input_params,
             "result": error_result,
             "timestamp": datetime.now().isoformat()
-        }, indent=2) 
\ No newline at end of file
+        }) 
\ No newline at end of file
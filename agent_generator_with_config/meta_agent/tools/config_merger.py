@@ -17,16 +17,178 @@ Config Merger Tool - Manages agent configuration state throughout the creation p
 Provides comprehensive functions for creating, updating, and managing agent configurations.
 """
 
+import functools
+import itertools
 import json
+import threading
 import uuid
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
-# In-memory storage for configurations (in production, this could be a database)
+from ..config import get_config
+from .session_store import SessionStore
+from .tool_cache import lookup_tool, remember_tool
+
+# orjson is optional; every config tool response goes through it, datetimes included.
+# Responses are compact: they are read by the orchestrator model, not by people
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _encode_datetime(obj: Any) -> str:
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=_encode_datetime)
+
+# Bound once; every tool response and config update reads the clock through it
+_now = datetime.now
+
+# In-memory storage for configurations, optionally mirrored to SQLite by _session_store
 _config_storage: Dict[str, Dict[str, Any]] = {}
 
+# Revision of each stored session, bumped by every mutating tool. Revisions come
+# from one process-wide counter, so a recreated session never reuses an old one;
+# unlike updated_at they also differ for two updates within one clock tick
+_revision_counter = itertools.count(1)
+_session_revisions: Dict[str, int] = {}
+
+# Called with the session ID after delete_session removes a session, so tools
+# that keep their own per-session caches can drop them too
+_session_delete_listeners: List[Callable[[str], None]] = []
+
+# Serialized get_full_config/get_config_summary responses per session, keyed by
+# the session revision they were built from
+_full_config_responses: Dict[str, Tuple[int, str]] = {}
+_summary_responses: Dict[str, Tuple[int, str]] = {}
+
+
+# Sessions are spread over a fixed set of re-entrant locks, so tool calls for
+# one session never interleave while unrelated sessions rarely contend
+_LOCK_SHARDS = 16
+_session_locks = tuple(threading.RLock() for _ in range(_LOCK_SHARDS))
+
+
+def _session_lock(session_id: str) -> "threading.RLock":
+    """Return the lock shard guarding a session."""
+    return _session_locks[hash(session_id) % _LOCK_SHARDS]
+
+
+def _session_id_argument(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    # ADK passes tool arguments by keyword; direct callers usually pass session_id first
+    return kwargs["session_id"] if "session_id" in kwargs else args[0]
+
+
+def _locked_session(func):
+    """Run a tool while holding the lock shard of its session_id argument."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _session_lock(_session_id_argument(args, kwargs)):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _bump_revision(session_id: str) -> None:
+    """Give a session a new revision, or forget it once the session is gone."""
+    if session_id in _config_storage:
+        _session_revisions[session_id] = next(_revision_counter)
+    else:
+        _session_revisions.pop(session_id, None)
+
+
+def _persisted_session(func):
+    """
+    Like _locked_session for a tool that changes its session: the session gets
+    a new revision before the lock is released, then is queued to be written to
+    the session database.
+    """
+    @functools.wraps(func)
+    def mutating(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _bump_revision(_session_id_argument(args, kwargs))
+
+    locked = _locked_session(mutating)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return locked(*args, **kwargs)
+        finally:
+            if _session_store is not None:
+                _session_store.schedule(_session_id_argument(args, kwargs))
+    return wrapper
 
+
+def _snapshot_session(session_id: str) -> Optional[str]:
+    """Serialize a session for the session database, or return None once it is deleted."""
+    with _session_lock(session_id):
+        config = _config_storage.get(session_id)
+        return None if config is None else _dumps(config)
+
+
+# Sessions are also written to SQLite, off the tool call path, when
+# AGENT_CREATOR_SESSION_DB_PATH is set; stored sessions are loaded back on import
+_session_store: Optional[SessionStore] = None
+if get_config().SESSION_DB_PATH:
+    _session_store = SessionStore(get_config().SESSION_DB_PATH, _snapshot_session)
+    _config_storage.update(_session_store.load())
+    _session_revisions.update((session_id, next(_revision_counter)) for session_id in _config_storage)
+
+
+def _tool_response(
+    tool: str,
+    input_params: Dict[str, Any],
+    result: Dict[str, Any],
+    timestamp: Optional[datetime] = None
+) -> str:
+    """Build the response of a tool that echoes its input back."""
+    return _dumps({
+        "tool": tool,
+        "input": input_params,
+        "result": result,
+        "timestamp": timestamp or _now()
+    })
+
+
+def _error_response(
+    tool: str,
+    input_params: Dict[str, Any],
+    error: str
+) -> str:
+    """Build the failure response of a tool that echoes its input back."""
+    return _tool_response(tool, input_params, {"success": False, "error": error})
+
+
+def _add_requirements(project_config: Dict[str, Any], packages: List[str]) -> None:
+    """Append packages missing from the project requirements, keeping their order."""
+    requirements = project_config["requirements"]
+    listed = set(requirements)
+    for package in packages:
+        if package not in listed:
+            listed.add(package)
+            requirements.append(package)
+
+
+def _mapping_changes(current: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """Describe the keys an update adds to or modifies in a mapping, before it is applied."""
+    added = {}
+    modified = {}
+    for key, value in updates.items():
+        if key not in current:
+            added[key] = value
+        elif current[key] != value:
+            modified[key] = {"old": current[key], "new": value}
+    return {"added": added, "modified": modified}
+
+
+@_persisted_session
 def create_project(
     session_id: str,
     project_name: str,
@@ -53,10 +215,12 @@ def create_project(
     }
     
     try:
+        now = _now()
+        created_at = now.isoformat()
         config = {
             "session_id": session_id,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": created_at,
+            "updated_at": created_at,
             "project_config": {
                 "project_name": project_name,
                 "description": description,
@@ -95,27 +259,13 @@ def create_project(
             }
         }
         
-        return json.dumps({
-            "tool": "create_project",
-            "input": input_params,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _tool_response("create_project", input_params, result, now)
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": f"Failed to create project: {str(e)}"
-        }
-        
-        return json.dumps({
-            "tool": "create_project",
-            "input": input_params,
-            "result": error_result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _error_response("create_project", input_params, f"Failed to create project: {str(e)}")
 
 
+@_persisted_session
 def update_project_metadata(
     session_id: str,
     main_agent: Optional[str] = None,
@@ -145,44 +295,34 @@ def update_project_metadata(
     }
     
     try:
-        if session_id not in _config_storage:
-            error_result = {
-                "success": False,
-                "error": f"Session {session_id} not found"
-            }
-            return json.dumps({
-                "tool": "update_project_metadata",
-                "input": input_params,
-                "result": error_result,
-                "timestamp": datetime.now().isoformat()
-            })
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _error_response("update_project_metadata", input_params, f"Session {session_id} not found")
         
-        config = _config_storage[session_id]
+        project_config = config["project_config"]
         changes = {}
         
         if main_agent:
-            old_main_agent = config["project_config"]["main_agent"]
-            config["project_config"]["main_agent"] = main_agent
+            old_main_agent = project_config["main_agent"]
+            project_config["main_agent"] = main_agent
             changes["main_agent"] = {"old": old_main_agent, "new": main_agent}
             
+        # Only what an update adds or modifies is reported, not full before/after copies
         if requirements:
-            old_requirements = config["project_config"]["requirements"].copy()
-            config["project_config"]["requirements"].extend(requirements)
-            # Remove duplicates
-            config["project_config"]["requirements"] = list(set(config["project_config"]["requirements"]))
-            changes["requirements"] = {"old": old_requirements, "new": config["project_config"]["requirements"]}
+            listed_count = len(project_config["requirements"])
+            _add_requirements(project_config, requirements)
+            changes["requirements"] = {"added": project_config["requirements"][listed_count:]}
             
         if environment_variables:
-            old_env_vars = config["project_config"]["environment_variables"].copy()
-            config["project_config"]["environment_variables"].update(environment_variables)
-            changes["environment_variables"] = {"old": old_env_vars, "new": config["project_config"]["environment_variables"]}
+            changes["environment_variables"] = _mapping_changes(project_config["environment_variables"], environment_variables)
+            project_config["environment_variables"].update(environment_variables)
             
         if environment_variables_example:
-            old_env_vars_example = config["project_config"]["environment_variables_example"].copy()
-            config["project_config"]["environment_variables_example"].update(environment_variables_example)
-            changes["environment_variables_example"] = {"old": old_env_vars_example, "new": config["project_config"]["environment_variables_example"]}
+            changes["environment_variables_example"] = _mapping_changes(project_config["environment_variables_example"], environment_variables_example)
+            project_config["environment_variables_example"].update(environment_variables_example)
         
-        config["updated_at"] = datetime.now().isoformat()
+        now = _now()
+        config["updated_at"] = now.isoformat()
         
         result = {
             "success": True,
@@ -195,34 +335,20 @@ def update_project_metadata(
                 "environment_variables_example": environment_variables_example is not None
             },
             "current_config": {
-                "project_name": config["project_config"]["project_name"],
-                "main_agent": config["project_config"]["main_agent"],
-                "requirements_count": len(config["project_config"]["requirements"]),
-                "env_vars_count": len(config["project_config"]["environment_variables"])
+                "project_name": project_config["project_name"],
+                "main_agent": project_config["main_agent"],
+                "requirements_count": len(project_config["requirements"]),
+                "env_vars_count": len(project_config["environment_variables"])
             }
         }
         
-        return json.dumps({
-            "tool": "update_project_metadata",
-            "input": input_params,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _tool_response("update_project_metadata", input_params, result, now)
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": f"Failed to update project metadata: {str(e)}"
-        }
-        
-        return json.dumps({
-            "tool": "update_project_metadata",
-            "input": input_params,
-            "result": error_result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _error_response("update_project_metadata", input_params, f"Failed to update project metadata: {str(e)}")
 
 
+@_persisted_session
 def add_agent_to_config(
     session_id: str,
     agent_name: str,
@@ -264,19 +390,9 @@ def add_agent_to_config(
     }
     
     try:
-        if session_id not in _config_storage:
-            error_result = {
-                "success": False,
-                "error": f"Session {session_id} not found"
-            }
-            return json.dumps({
-                "tool": "add_agent_to_config",
-                "input": input_params,
-                "result": error_result,
-                "timestamp": datetime.now().isoformat()
-            })
-        
-        config = _config_storage[session_id]
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _error_response("add_agent_to_config", input_params, f"Session {session_id} not found")
         
         agent_config = {
             "name": agent_name,
@@ -292,38 +408,26 @@ def add_agent_to_config(
             agent_config["model"] = model or "gemini-2.0-flash-lite-001"
             agent_config["instruction"] = instruction or "You are a helpful AI assistant."
         
-        config["project_config"]["agents"][agent_name] = agent_config
-        config["updated_at"] = datetime.now().isoformat()
+        agents = config["project_config"]["agents"]
+        agents[agent_name] = agent_config
+        now = _now()
+        config["updated_at"] = now.isoformat()
         
         result = {
             "success": True,
             "message": f"Agent '{agent_name}' added successfully",
-            "agent_added": agent_config,
-            "total_agents": len(config["project_config"]["agents"]),
-            "all_agents": list(config["project_config"]["agents"].keys())
+            # The caller sent the agent itself; echoing it back only costs context
+            "agent_name": agent_name,
+            "total_agents": len(agents)
         }
         
-        return json.dumps({
-            "tool": "add_agent_to_config",
-            "input": input_params,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _tool_response("add_agent_to_config", input_params, result, now)
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": f"Failed to add agent: {str(e)}"
-        }
-        
-        return json.dumps({
-            "tool": "add_agent_to_config",
-            "input": input_params,
-            "result": error_result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _error_response("add_agent_to_config", input_params, f"Failed to add agent: {str(e)}")
 
 
+@_persisted_session
 def update_agent_in_config(
     session_id: str,
     agent_name: str,
@@ -362,93 +466,81 @@ def update_agent_in_config(
     }
     
     try:
-        if session_id not in _config_storage:
-            error_result = {
-                "success": False,
-                "error": f"Session {session_id} not found"
-            }
-            return json.dumps({
-                "tool": "update_agent_in_config",
-                "input": input_params,
-                "result": error_result,
-                "timestamp": datetime.now().isoformat()
-            })
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _error_response("update_agent_in_config", input_params, f"Session {session_id} not found")
         
-        config = _config_storage[session_id]
-        
-        if agent_name not in config["project_config"]["agents"]:
-            error_result = {
-                "success": False,
-                "error": f"Agent '{agent_name}' not found"
-            }
-            return json.dumps({
-                "tool": "update_agent_in_config",
-                "input": input_params,
-                "result": error_result,
-                "timestamp": datetime.now().isoformat()
-            })
+        agent_config = config["project_config"]["agents"].get(agent_name)
+        if agent_config is None:
+            return _error_response("update_agent_in_config", input_params, f"Agent '{agent_name}' not found")
         
-        agent_config = config["project_config"]["agents"][agent_name]
-        old_config = agent_config.copy()
-        changes = {}
+        updated_fields = []
         
         # Update fields if provided
         if description:
-            old_description = agent_config.get("description", "")
             agent_config["description"] = description
-            changes["description"] = {"old": old_description, "new": description}
+            updated_fields.append("description")
         if model and agent_config.get("type") == "llm_agent":
-            old_model = agent_config.get("model", "")
             agent_config["model"] = model
-            changes["model"] = {"old": old_model, "new": model}
+            updated_fields.append("model")
         if instruction and agent_config.get("type") == "llm_agent":
-            old_instruction = agent_config.get("instruction", "")
             agent_config["instruction"] = instruction
-            changes["instruction"] = {"old": old_instruction, "new": instruction}
+            updated_fields.append("instruction")
         if tools is not None:
-            old_tools = agent_config.get("tools", [])
             agent_config["tools"] = tools
-            changes["tools"] = {"old": old_tools, "new": tools}
+            updated_fields.append("tools")
         if sub_agents is not None:
-            old_sub_agents = agent_config.get("sub_agents", [])
             agent_config["sub_agents"] = sub_agents
-            changes["sub_agents"] = {"old": old_sub_agents, "new": sub_agents}
+            updated_fields.append("sub_agents")
         if config_params:
-            old_config_params = agent_config.get("config", {}).copy()
             agent_config["config"].update(config_params)
-            changes["config_params"] = {"old": old_config_params, "new": agent_config["config"]}
+            updated_fields.append("config_params")
         
-        config["updated_at"] = datetime.now().isoformat()
+        now = _now()
+        config["updated_at"] = now.isoformat()
         
         result = {
             "success": True,
             "message": f"Agent '{agent_name}' updated successfully",
             "agent_name": agent_name,
-            "changes": changes,
-            "updated_agent": agent_config
+            "updated_fields": updated_fields
         }
         
-        return json.dumps({
-            "tool": "update_agent_in_config",
-            "input": input_params,
-            "result": result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _tool_response("update_agent_in_config", input_params, result, now)
         
     except Exception as e:
-        error_result = {
-            "success": False,
-            "error": f"Failed to update agent: {str(e)}"
-        }
-        
-        return json.dumps({
-            "tool": "update_agent_in_config",
-            "input": input_params,
-            "result": error_result,
-            "timestamp": datetime.now().isoformat()
-        }, indent=2)
+        return _error_response("update_agent_in_config", input_params, f"Failed to update agent: {str(e)}")
+
+
+def _build_tool_config(
+    tool_name: str,
+    tool_type: str,
+    description: str,
+    builtin_type: Optional[str] = None,
+    function_code: Optional[str] = None,
+    imports: Optional[List[str]] = None,
+    dependencies: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Build the stored configuration entry for one tool."""
+    tool_config = {
+        "name": tool_name,
+        "type": tool_type,
+        "description": description
+    }
+    
+    if tool_type == "builtin":
+        tool_config["builtin_type"] = builtin_type
+    elif tool_type == "custom_function":
+        tool_config["function_code"] = function_code
+        if imports:
+            tool_config["imports"] = imports
+        if dependencies:
+            tool_config["dependencies"] = dependencies
+    
+    return tool_config
 
 
+@_persisted_session
 def add_tool_to_config(
     session_id: str,
     tool_name: str,
@@ -487,49 +579,157 @@ def add_tool_to_config(
     }
     
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _dumps({
                 "success": False,
                 "error": f"Session {session_id} not found"
             })
         
-        config = _config_storage[session_id]
-        
-        tool_config = {
-            "name": tool_name,
-            "type": tool_type,
-            "description": description
-        }
-        
-        if tool_type == "builtin":
-            tool_config["builtin_type"] = builtin_type
-        elif tool_type == "custom_function":
-            tool_config["function_code"] = function_code
-            if imports:
-                tool_config["imports"] = imports
-            if dependencies:
-                tool_config["dependencies"] = dependencies
-                # Add dependencies to project requirements
-                config["project_config"]["requirements"].extend(dependencies)
-                config["project_config"]["requirements"] = list(set(config["project_config"]["requirements"]))
-        
-        config["project_config"]["tools"][tool_name] = tool_config
-        config["updated_at"] = datetime.now().isoformat()
-        
-        return json.dumps({
+        project_config = config["project_config"]
+        tool_config = _build_tool_config(
+            tool_name, tool_type, description, builtin_type, function_code, imports, dependencies
+        )
+        if tool_config.get("dependencies"):
+            # Add dependencies to project requirements
+            _add_requirements(project_config, dependencies)
+        
+        project_config["tools"][tool_name] = tool_config
+        config["updated_at"] = _now().isoformat()
+        remember_tool(tool_config)
+        
+        return _dumps({
             "success": True,
             "message": f"Tool '{tool_name}' added successfully",
             "tool_name": tool_name,
             "tool_type": tool_type
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to add tool: {str(e)}"
-        }, indent=2)
+        })
+
+
+@_persisted_session
+def add_tools_to_config_bulk(session_id: str, tools: List[Dict[str, Any]]) -> str:
+    """
+    Add several tools to the project configuration in one call.
+    
+    Args:
+        session_id: Session identifier
+        tools: Tool definitions, each with "name", "type" and "description" and,
+            as for add_tool_to_config, optional "builtin_type", "function_code",
+            "imports" and "dependencies"
+        
+    Returns:
+        JSON string with add status
+    """
+    try:
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _dumps({
+                "success": False,
+                "error": f"Session {session_id} not found"
+            })
+        
+        project_config = config["project_config"]
+        project_tools = project_config["tools"]
+        
+        # Build every definition before touching the session, so a malformed
+        # entry anywhere in the batch leaves the project unchanged
+        tool_configs = [
+            _build_tool_config(
+                tool["name"],
+                tool["type"],
+                tool["description"],
+                tool.get("builtin_type"),
+                tool.get("function_code"),
+                tool.get("imports"),
+                tool.get("dependencies")
+            )
+            for tool in tools
+        ]
+        
+        added = []
+        dependencies = []
+        for tool_config in tool_configs:
+            dependencies.extend(tool_config.get("dependencies", []))
+            project_tools[tool_config["name"]] = tool_config
+            remember_tool(tool_config)
+            added.append(tool_config["name"])
+        
+        # Merge the project requirements once for the whole batch
+        _add_requirements(project_config, dependencies)
+        config["updated_at"] = _now().isoformat()
+        
+        return _dumps({
+            "success": True,
+            "message": f"{len(added)} tools added successfully",
+            "tools_added": added,
+            "total_tools": len(project_tools)
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to add tools: {str(e)}"
+        })
+
+
+@_persisted_session
+def add_cached_tools_to_config(session_id: str, tool_requests: List[str]) -> str:
+    """
+    Add builtin tools and tools built in earlier sessions without the tool builder.
+    
+    Args:
+        session_id: Session identifier
+        tool_requests: Tools the project needs, each as "TOOL_NAME - DESCRIPTION"
+            in the form used for tool_builder requests
+        
+    Returns:
+        JSON string with the names of the tools that were added directly and
+        the requests that are missing and still need the tool builder
+    """
+    try:
+        if session_id not in _config_storage:
+            return _dumps({
+                "success": False,
+                "error": f"Session {session_id} not found"
+            })
+        
+        cached = []
+        missing = []
+        for tool_request in tool_requests:
+            tool_name, _, description = tool_request.partition(" - ")
+            tool_config = lookup_tool(tool_name, description)
+            if tool_config is None:
+                missing.append(tool_request)
+            else:
+                cached.append(tool_config)
+        
+        if cached:
+            # Cached entries go through the regular merge path
+            bulk_result = json.loads(add_tools_to_config_bulk(session_id, cached))
+            if not bulk_result["success"]:
+                return _dumps(bulk_result)
+        
+        return _dumps({
+            "success": True,
+            "message": f"{len(cached)} tools added without building, {len(missing)} still need building",
+            "tools_added": [tool["name"] for tool in cached],
+            "tools_missing": missing
+        })
+        
+    except Exception as e:
+        return _dumps({
+            "success": False,
+            "error": f"Failed to add cached tools: {str(e)}"
+        })
 
 
+@_persisted_session
 def update_tool_in_config(
     session_id: str,
     tool_name: str,
@@ -553,22 +753,20 @@ def update_tool_in_config(
         JSON string with update status
     """
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _dumps({
                 "success": False,
                 "error": f"Session {session_id} not found"
             })
         
-        config = _config_storage[session_id]
-        
-        if tool_name not in config["project_config"]["tools"]:
-            return json.dumps({
+        tool_config = config["project_config"]["tools"].get(tool_name)
+        if tool_config is None:
+            return _dumps({
                 "success": False,
                 "error": f"Tool '{tool_name}' not found"
             })
         
-        tool_config = config["project_config"]["tools"][tool_name]
-        
         # Update fields if provided
         if description:
             tool_config["description"] = description
@@ -579,23 +777,77 @@ def update_tool_in_config(
         if dependencies is not None and tool_config.get("type") == "custom_function":
             tool_config["dependencies"] = dependencies
             # Update project requirements
-            config["project_config"]["requirements"].extend(dependencies)
-            config["project_config"]["requirements"] = list(set(config["project_config"]["requirements"]))
+            _add_requirements(config["project_config"], dependencies)
         
-        config["updated_at"] = datetime.now().isoformat()
+        config["updated_at"] = _now().isoformat()
+        remember_tool(tool_config)
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Tool '{tool_name}' updated successfully"
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to update tool: {str(e)}"
-        }, indent=2)
+        })
+
+
+def get_config_revision(session_id: str) -> Optional[int]:
+    """
+    Get a session's revision, which changes on every update to its config.
+    
+    For in-process callers that cache what they derive from a config. Read the
+    revision before the config: an update in between then only makes the
+    cached entry look stale, never current.
+    
+    Args:
+        session_id: Session identifier
+        
+    Returns:
+        The current revision, or None if the session does not exist
+    """
+    return _session_revisions.get(session_id)
+
+
+def add_session_delete_listener(listener: Callable[[str], None]) -> None:
+    """
+    Register a function to call with the session ID whenever a session is deleted.
+    
+    Args:
+        listener: Called after the session has been removed from storage
+    """
+    _session_delete_listeners.append(listener)
+
+
+def get_full_config_obj(session_id: str) -> Dict[str, Any]:
+    """
+    Get the complete configuration for a session without serializing it.
+    
+    For in-process callers; the returned config is the stored object itself,
+    so it must not be modified.
+    
+    Args:
+        session_id: Session identifier
+        
+    Returns:
+        Dictionary with the same content as get_full_config
+    """
+    config = _config_storage.get(session_id)
+    if config is None:
+        return {
+            "success": False,
+            "error": f"Session {session_id} not found"
+        }
+    
+    return {
+        "success": True,
+        "config": config
+    }
 
 
+@_locked_session
 def get_full_config(session_id: str) -> str:
     """
     Get the complete configuration for a session.
@@ -607,26 +859,27 @@ def get_full_config(session_id: str) -> str:
         JSON string with the full configuration
     """
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
-                "success": False,
-                "error": f"Session {session_id} not found"
-            })
+        result = get_full_config_obj(session_id)
+        if not result["success"]:
+            return _dumps(result)
         
-        config = _config_storage[session_id]
+        version = _session_revisions.get(session_id)
+        cached = _full_config_responses.get(session_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
         
-        return json.dumps({
-            "success": True,
-            "config": config
-        }, indent=2)
+        response = _dumps(result)
+        _full_config_responses[session_id] = (version, response)
+        return response
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to get config: {str(e)}"
-        }, indent=2)
+        })
 
 
+@_locked_session
 def get_config_summary(session_id: str) -> str:
     """
     Get a summary of the current configuration state.
@@ -638,13 +891,18 @@ def get_config_summary(session_id: str) -> str:
         JSON string with configuration summary
     """
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _dumps({
                 "success": False,
                 "error": f"Session {session_id} not found"
             })
         
-        config = _config_storage[session_id]
+        version = _session_revisions.get(session_id)
+        cached = _summary_responses.get(session_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
         project_config = config["project_config"]
         
         summary = {
@@ -661,18 +919,21 @@ def get_config_summary(session_id: str) -> str:
             "updated_at": config["updated_at"]
         }
         
-        return json.dumps({
+        response = _dumps({
             "success": True,
             "summary": summary
-        }, indent=2)
+        })
+        _summary_responses[session_id] = (version, response)
+        return response
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to get config summary: {str(e)}"
-        }, indent=2)
+        })
 
 
+@_persisted_session
 def update_build_context(
     session_id: str,
     requirements_analysis: Optional[Dict] = None,
@@ -698,13 +959,13 @@ def update_build_context(
         JSON string with update status
     """
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
+        config = _config_storage.get(session_id)
+        if config is None:
+            return _dumps({
                 "success": False,
                 "error": f"Session {session_id} not found"
             })
         
-        config = _config_storage[session_id]
         build_context = config["build_context"]
         
         if requirements_analysis is not None:
@@ -720,20 +981,21 @@ def update_build_context(
         if current_tool_being_built is not None:
             build_context["current_tool_being_built"] = current_tool_being_built
         
-        config["updated_at"] = datetime.now().isoformat()
+        config["updated_at"] = _now().isoformat()
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": "Build context updated successfully"
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to update build context: {str(e)}"
-        }, indent=2)
+        })
 
 
+@_persisted_session
 def delete_session(session_id: str) -> str:
     """
     Delete a session and its configuration.
@@ -745,24 +1007,27 @@ def delete_session(session_id: str) -> str:
         JSON string with deletion status
     """
     try:
-        if session_id not in _config_storage:
-            return json.dumps({
+        if _config_storage.pop(session_id, None) is None:
+            return _dumps({
                 "success": False,
                 "error": f"Session {session_id} not found"
             })
         
-        del _config_storage[session_id]
+        _full_config_responses.pop(session_id, None)
+        _summary_responses.pop(session_id, None)
+        for listener in _session_delete_listeners:
+            listener(session_id)
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "message": f"Session {session_id} deleted successfully"
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to delete session: {str(e)}"
-        }, indent=2)
+        })
 
 
 def list_sessions() -> str:
@@ -773,24 +1038,28 @@ def list_sessions() -> str:
         JSON string with list of sessions
     """
     try:
-        sessions = []
-        for session_id, config in _config_storage.items():
-            sessions.append({
+        # Iterate over a snapshot; other threads may add or delete sessions meanwhile
+        sessions = [
+            {
                 "session_id": session_id,
-                "project_name": config["project_config"]["project_name"],
+                "project_name": project_config["project_name"],
                 "created_at": config["created_at"],
                 "updated_at": config["updated_at"],
-                "agent_count": len(config["project_config"]["agents"]),
-                "tool_count": len(config["project_config"]["tools"])
-            })
+                "agent_count": len(project_config["agents"]),
+                "tool_count": len(project_config["tools"])
+            }
+            for session_id, config in list(_config_storage.items())
+            # Binds project_config once per session
+            for project_config in (config["project_config"],)
+        ]
         
-        return json.dumps({
+        return _dumps({
             "success": True,
             "sessions": sessions
-        }, indent=2)
+        })
         
     except Exception as e:
-        return json.dumps({
+        return _dumps({
             "success": False,
             "error": f"Failed to list sessions: {str(e)}"
-        }, indent=2) 
\ No newline at end of file
+        }) 
\ No newline at end of file
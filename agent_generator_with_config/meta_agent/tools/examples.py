@@ -0,0 +1,48 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Examples Tool - Serves full orchestrator worked examples on demand.
+Keeps the long examples out of the orchestrator instruction sent on every turn.
+"""
+
+import json
+
+from ..prompts import ORCHESTRATOR_EXAMPLES
+
+
+def get_orchestrator_example(pattern: str = "simple") -> str:
+    """
+    Get a complete worked example of the agent creation workflow.
+    
+    Args:
+        pattern: Example to return - "simple" for a single agent with tools,
+            "sequential" for a multi-agent sequential workflow
+        
+    Returns:
+        JSON string with the requested example
+    """
+    example = ORCHESTRATOR_EXAMPLES.get(pattern)
+    if example is None:
+        return json.dumps({
+            "success": False,
+            "error": f"Unknown example pattern '{pattern}'",
+            "available_patterns": list(ORCHESTRATOR_EXAMPLES)
+        })
+    
+    return json.dumps({
+        "success": True,
+        "pattern": pattern,
+        "example": example
+    }, indent=2)
@@ -0,0 +1,134 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Requirements Heuristic Tool - Deterministic first pass over a user's request.
+Extracts purpose, capabilities, tools and complexity with keyword rules so simple
+requests can skip the LLM-based analysis entirely.
+"""
+
+import json
+import re
+from typing import Dict, List
+
+# Keyword patterns mapped to the tool they suggest, checked in order
+_TOOL_KEYWORDS = (
+    (r"search|look\s*up|research|find information", "google_search"),
+    (r"web\s*pages?|urls?|websites?|scrap\w*|links?", "url_context"),
+    (r"apis?|endpoints?|rest\b", "fetch_api_data"),
+    (r"databases?|sql|records?", "database_query"),
+    (r"files?|csv|excel|spreadsheets?|documents?", "file_operations"),
+    (r"e-?mails?", "send_email"),
+    (r"analy[sz]\w*|statistic\w*|insights?", "analyze_data"),
+    (r"reports?", "generate_report"),
+    (r"remember|memory|memories", "load_memory"),
+)
+
+# One alternation with a named group per tool, so a single scan finds all of them
+_TOOL_RE = re.compile(
+    "|".join(rf"(?P<t{i}>\b(?:{pattern}))" for i, (pattern, _) in enumerate(_TOOL_KEYWORDS)),
+    re.IGNORECASE,
+)
+
+_VERB_RE = re.compile(
+    r"\b(fetch|search|research|analy[sz]e|generate|process|classify|summari[sz]e|translate|"
+    r"track|send|schedule|extract|monitor|route|escalate|answer|handle|load|store)\w*\b"
+    # Skip noun uses such as "research assistant" or "processing agent"
+    r"(?!\s+(?:assistants?|agents?|bots?|systems?|specialists?)\b)"
+    r"((?:\s+(?!and\b|then\b|or\b|that\b|which\b|who\b|can\b)\w+){0,3})",
+    re.IGNORECASE,
+)
+
+# Words that signal a multi-step workflow rather than a single agent
+_WORKFLOW_RE = re.compile(
+    r"\b(then|after that|afterwards|workflow|pipeline|sequential\w*|parallel\w*|in parallel|"
+    r"escalat\w*|specialists?|multi-agent|multiple agents)\b",
+    re.IGNORECASE,
+)
+
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Connecting words dropped from the end of a captured verb phrase
+_TRAILING_WORDS = frozenset(("a", "an", "the", "for", "from", "to", "with", "that", "of", "in", "on", "by"))
+
+
+def _suggested_tools(text: str) -> List[str]:
+    """Return the tools whose keywords appear in the text, in keyword order."""
+    found = {match.lastgroup for match in _TOOL_RE.finditer(text)}
+    return [tool for i, (_, tool) in enumerate(_TOOL_KEYWORDS) if f"t{i}" in found]
+
+
+def _capabilities(text: str) -> List[str]:
+    """Return short verb phrases describing what the agent should do."""
+    capabilities = []
+    for match in _VERB_RE.finditer(text):
+        words = match.group(0).strip(" ,.;:").split()
+        while len(words) > 1 and words[-1].lower() in _TRAILING_WORDS:
+            words.pop()
+        phrase = " ".join(words)
+        if phrase and phrase.lower() not in (c.lower() for c in capabilities):
+            capabilities.append(phrase[0].upper() + phrase[1:])
+    return capabilities
+
+
+def _complexity(capabilities: List[str], workflow_signals: int) -> str:
+    """Classify the request using the same levels as the LLM analyzer."""
+    if workflow_signals >= 2 or len(capabilities) >= 5:
+        return "complex"
+    if workflow_signals == 1 or len(capabilities) >= 3:
+        return "medium"
+    return "simple"
+
+
+def analyze_requirements_fast(request: str) -> str:
+    """
+    Analyze a user's agent request with deterministic keyword rules.
+    
+    Args:
+        request: The user's description of the agent they want
+        
+    Returns:
+        JSON string with the analysis in the requirements analyzer format and a
+        confidence level; "low" means the LLM analysis should be used instead
+    """
+    try:
+        text = " ".join(request.split())
+        sentences = _SENTENCE_RE.split(text)
+        
+        tools = _suggested_tools(text)
+        capabilities = _capabilities(text)
+        workflow_signals = len(_WORKFLOW_RE.findall(text))
+        complexity = _complexity(capabilities, workflow_signals)
+        
+        analysis: Dict[str, object] = {
+            "purpose": sentences[0] if sentences and sentences[0] else text,
+            "main_capabilities": capabilities[:5],
+            "suggested_tools": tools,
+            "complexity": complexity
+        }
+        
+        # Only simple requests with recognizable tools are reliable without the LLM
+        confidence = "high" if complexity == "simple" and tools and capabilities else "low"
+        
+        return json.dumps({
+            "success": True,
+            "analysis": analysis,
+            "confidence": confidence
+        }, indent=2)
+        
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": f"Failed to analyze requirements: {str(e)}"
+        }, indent=2)
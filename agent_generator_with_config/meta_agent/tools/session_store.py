@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Session Store - Optional SQLite persistence for the config merger's sessions.
+Tool calls keep updating the in-memory storage directly; a background thread
+writes the sessions they changed to the database shortly afterwards.
+"""
+
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+
+class SessionStore:
+    """Write-behind SQLite copy of the in-memory session storage."""
+
+    def __init__(self, path: str, snapshot: Callable[[str], Optional[str]]):
+        """
+        Open (or create) the session database and start the writer thread.
+
+        Args:
+            path: Path of the SQLite database file
+            snapshot: Returns a session's config as JSON, or None once it is deleted
+        """
+        self._snapshot = snapshot
+        self._pending: "queue.Queue[str]" = queue.Queue()
+
+        # Only the writer thread uses the connection after load()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, config TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+        threading.Thread(target=self._run, name="session-store-writer", daemon=True).start()
+        # Write out what is still queued when the interpreter exits
+        atexit.register(self.flush)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Return every stored session config by session ID."""
+        rows = self._connection.execute("SELECT session_id, config FROM sessions").fetchall()
+        return {session_id: json.loads(config) for session_id, config in rows}
+
+    def schedule(self, session_id: str) -> None:
+        """Queue a session to be written; never blocks the calling tool."""
+        self._pending.put_nowait(session_id)
+
+    def flush(self) -> None:
+        """Wait until every queued session has been written."""
+        self._pending.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._pending.get()]
+            # Drain what queued up meanwhile; one write per session covers all its updates
+            while True:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(list(dict.fromkeys(batch)))
+            except Exception as e:
+                # The in-memory storage is still authoritative; keep the writer alive
+                print(f"Warning: Could not persist sessions: {e}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _write(self, session_ids: List[str]) -> None:
+        """Upsert or delete each session in a single transaction."""
+        with self._connection:
+            for session_id in session_ids:
+                config = self._snapshot(session_id)
+                if config is None:
+                    self._connection.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+                else:
+                    self._connection.execute(
+                        "INSERT INTO sessions (session_id, config) VALUES (?, ?) "
+                        "ON CONFLICT(session_id) DO UPDATE SET config = excluded.config",
+                        (session_id, config)
+                    )
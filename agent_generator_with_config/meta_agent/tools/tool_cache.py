@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tool Cache - Resolves tool definitions that need no tool builder call.
+ADK builtin tools are known up front, and a custom tool built in an earlier
+project for the same name and description is reused instead of asking the
+tool builder to write near-identical code again.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
+
+# ADK builtin tools by name; requests for these never need the tool builder
+BUILTIN_TOOLS = MappingProxyType({
+    "google_search": "Web search",
+    "url_context": "Load web page content",
+    "load_memory": "Access stored memories",
+    "preload_memory": "Load specific memories",
+    "load_artifacts": "Access saved artifacts",
+    "transfer_to_agent": "Call other agents",
+    "get_user_choice": "Ask user to choose from options",
+    "exit_loop": "Break out of loop agents",
+})
+
+# Least recently used entries are dropped once the cache is full
+_MAX_CACHED_TOOLS = 256
+
+# In-memory storage like the session configs, keyed by (tool name, normalized description)
+_tool_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+
+# Sessions run tools on several threads; every read-and-reorder of the cache holds this
+_tool_cache_lock = threading.Lock()
+
+
+def _cache_key(tool_name: str, description: str) -> Tuple[str, str]:
+    """Key a tool by its name and what it is asked to do."""
+    # Case and separators are kept in the name: it must match the function in
+    # function_code. The description tells apart unrelated tools that share a
+    # common name such as process_data.
+    return tool_name.strip(), " ".join(description.lower().split())
+
+
+def remember_tool(tool_config: Dict[str, Any]) -> None:
+    """Store a copy of a finished tool definition for later sessions."""
+    # Builtin tools are cheap to redefine; only custom code is worth caching
+    if tool_config.get("type") != "custom_function" or not tool_config.get("function_code"):
+        return
+
+    key = _cache_key(tool_config["name"], tool_config.get("description", ""))
+    stored = copy.deepcopy(tool_config)
+    with _tool_cache_lock:
+        _tool_cache[key] = stored
+        _tool_cache.move_to_end(key)
+        if len(_tool_cache) > _MAX_CACHED_TOOLS:
+            _tool_cache.popitem(last=False)
+
+
+def lookup_tool(tool_name: str, description: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Return the builtin or cached definition for a tool, or None.
+    
+    Args:
+        tool_name: Name of the tool
+        description: What the tool should do; a cached custom tool is only
+            reused when it was built for the same description
+        
+    Returns:
+        A copy of the tool definition, or None if it still needs building
+    """
+    tool_name = tool_name.strip()
+    if tool_name in BUILTIN_TOOLS:
+        return {
+            "name": tool_name,
+            "type": "builtin",
+            "description": BUILTIN_TOOLS[tool_name],
+            "builtin_type": tool_name
+        }
+    
+    key = _cache_key(tool_name, description)
+    with _tool_cache_lock:
+        tool_config = _tool_cache.get(key)
+        if tool_config is None:
+            return None
+        _tool_cache.move_to_end(key)
+    # Stored entries are never mutated in place, so the copy can be made unlocked
+    return copy.deepcopy(tool_config)
+
+
+def clear_tool_cache() -> None:
+    """Forget every cached tool definition."""
+    with _tool_cache_lock:
+        _tool_cache.clear()
@@ -287,12 +287,13 @@ You have access to basic calculator functions and statistical operations.""",
         result = eval_expr(tree.body)
         
         # Store calculation in context
-        if 'calculations' not in tool_context.state:
-            tool_context.state['calculations'] = []
-        tool_context.state['calculations'].append({
+        history = tool_context.state.get('calculations', [])
+        history.append({
             'expression': expression,
             'result': result
         })
+        # Keep only the most recent entries so session state stays bounded
+        tool_context.state['calculations'] = history[-100:]
         
         return result
     except Exception as e:
@@ -341,13 +342,14 @@ You have access to basic calculator functions and statistical operations.""",
         result = operations[operation](numbers)
         
         # Store calculation in context
-        if 'statistics' not in tool_context.state:
-            tool_context.state['statistics'] = []
-        tool_context.state['statistics'].append({
+        history = tool_context.state.get('statistics', [])
+        history.append({
             'numbers': numbers,
             'operation': operation,
             'result': result
         })
+        # Keep only the most recent entries so session state stays bounded
+        tool_context.state['statistics'] = history[-100:]
         
         return result
     except Exception as e:
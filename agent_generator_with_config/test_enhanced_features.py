@@ -18,13 +18,16 @@ Test script for enhanced agent generator features:
 2. Environment variables (actual and example values)
 """
 
+import inspect
 import json
 import os
 import shutil
 from pathlib import Path
 
+import pytest
+
 from config_schema import AgentProjectConfig, validate_agent_config
-from code_generator import AgentCodeGenerator
+from code_generator import BASE_IMPORTS, AgentCodeGenerator
 from enhanced_test_configs import (
     enhanced_custom_tool_config,
     web_scraper_config,
@@ -223,6 +226,135 @@ def test_import_generated_agents():
                 sys.path.remove(str(output_dir))
 
 
+def _custom_tool_config(function_code: str, imports=None, optimize: bool = False) -> AgentProjectConfig:
+    """Build a one-agent config around a single custom tool."""
+    return AgentProjectConfig(**{
+        "project_name": "generator_checks",
+        "description": "Generator behavior checks",
+        "main_agent": "checker",
+        "agents": {
+            "checker": {
+                "name": "checker",
+                "type": "llm_agent",
+                "description": "Agent using the tool under test",
+                "tools": ["tool_under_test"]
+            }
+        },
+        "tools": {
+            "tool_under_test": {
+                "name": "tool_under_test",
+                "type": "custom_function",
+                "description": "Tool under test",
+                "function_code": function_code,
+                "imports": imports or []
+            }
+        },
+        "environment_variables": {"API_KEY": "secret-value"},
+        "optimize_custom_functions": optimize
+    })
+
+
+def test_custom_tool_imports():
+    """Test which custom tool import forms are accepted and how they are emitted."""
+    print("\n" + "="*60)
+    print("Testing custom tool import validation...")
+    
+    generator = AgentCodeGenerator()
+    function_code = "def tool_under_test() -> str:\n    return 'ok'"
+    
+    accepted = [
+        ("import os  # env", ["import os"]),
+        ("import os; import re", ["import os", "import re"]),
+        ("import json;", ["import json"]),
+        ("import numpy   as  np", ["import numpy as np"]),
+        ("from typing import (List,  # lists\n    Dict)", ["from typing import (List, Dict)"]),
+        ("from . import helpers", ["from . import helpers"]),
+    ]
+    # Every agent.py gets the base imports, plus the typing import when it has custom tools
+    always = set(BASE_IMPORTS) | {"from typing import List, Dict, Any, Optional"}
+    for import_stmt, expected in accepted:
+        config = _custom_tool_config(function_code, imports=[import_stmt])
+        imports = generator._collect_imports(config)
+        assert imports == sorted(always | set(expected)), imports
+        lines = generator.generate_from_config(config)["agent.py"].splitlines()
+        assert all(statement in lines for statement in expected), lines
+        print(f"✓ Accepted {import_stmt!r}")
+    
+    rejected = [
+        "import os; os.system('ls')",
+        "print('not an import')",
+        "from os import",
+        "import",
+    ]
+    for import_stmt in rejected:
+        with pytest.raises(ValueError):
+            generator.generate_from_config(_custom_tool_config(function_code, imports=[import_stmt]))
+        print(f"✓ Rejected {import_stmt!r}")
+
+
+def test_custom_function_optimization():
+    """Test the opt-in rewrites applied to custom function code."""
+    print("\n" + "="*60)
+    print("Testing custom function optimization...")
+    
+    generator = AgentCodeGenerator()
+    
+    rewritten = '''
+def tool_under_test() -> str:
+    """Docstring is kept."""
+    # This comment is dropped once the function is rewritten
+    timeout = 60 * 5
+    if False:
+        timeout = 0
+    return f"{os.getenv('API_KEY')}:{timeout}"
+'''
+    content = generator.generate_from_config(_custom_tool_config(rewritten, optimize=True))["agent.py"]
+    compile(content, "agent.py", "exec")
+    print("✓ Optimized agent.py compiles")
+    
+    assert "timeout = 300" in content and "60 * 5" not in content, content
+    print("✓ Constant arithmetic is folded")
+    assert "if False" not in content and "timeout = 0" not in content, content
+    print("✓ Constant-false branch is removed")
+    assert "Docstring is kept." in content, content
+    print("✓ Docstring is kept")
+    assert "This comment is dropped" not in content, content
+    print("✓ Comments are dropped from rewritten code")
+    assert "os.getenv('API_KEY')" in content and "secret-value" not in content, content
+    print("✓ Environment lookups are not inlined")
+    
+    untouched = '''
+def tool_under_test(x: int) -> int:
+    """Doubles x."""
+    # Nothing here can be rewritten, so this comment survives
+    return x * 2
+'''
+    content = generator.generate_from_config(_custom_tool_config(untouched, optimize=True))["agent.py"]
+    assert untouched.strip() in content, content
+    print("✓ Code without rewrites keeps its comments")
+    
+    content = generator.generate_from_config(_custom_tool_config(rewritten))["agent.py"]
+    assert rewritten.strip() in content, content
+    print("✓ Code is copied verbatim when the option is off")
+    
+    # The dead branch holds the only yield; removing it would make a plain function
+    generator_tool = '''
+def tool_under_test():
+    """Yields nothing."""
+    return
+    if False:
+        yield 60 * 5
+'''
+    config = _custom_tool_config(generator_tool, optimize=True)
+    function_code = generator._prepare_function_code(generator_tool, config)
+    namespace = {}
+    exec(compile(function_code, "tool_under_test", "exec"), namespace)
+    assert inspect.isgeneratorfunction(namespace["tool_under_test"]), function_code
+    assert "yield 300" in function_code, function_code
+    assert function_code in generator.generate_from_config(config)["agent.py"]
+    print("✓ Dead branch holding the only yield is kept")
+
+
 def print_feature_summary():
     """Print a summary of enhanced features."""
     print("\n" + "="*60)
@@ -262,6 +394,8 @@ if __name__ == "__main__":
     test_enhanced_config_validation()
     test_code_generation()
     test_import_generated_agents()
+    test_custom_tool_imports()
+    test_custom_function_optimization()
     print_feature_summary()
     
     print(f"\n✓ Enhanced features testing completed!")